@@ -0,0 +1,24 @@
+"""Response classes for the REST API."""
+
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic_core import to_json
+
+
+class ModelResponse(Response):
+    """
+    JSON response rendered directly from a pydantic model.
+
+    Returning a model from a route with ``response_model`` set makes FastAPI
+    dump it, revalidate the dump against the response model and re-encode it
+    with ``json.dumps``. For large results (bulk comparisons with full DNS
+    responses) that round trip dominates; this serializes once in
+    pydantic-core instead. Keep ``response_model`` on the route for the
+    OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
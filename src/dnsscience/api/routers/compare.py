@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Depends, BackgroundTasks
 from pydantic import BaseModel
 
+from dnsscience.api.responses import ModelResponse
 from dnsscience.core.coredns.client import CoreDNSClient
 from dnsscience.core.compare.engine import CompareEngine
 from dnsscience.core.compare.shadow import ShadowMode
@@ -60,7 +61,7 @@ async def compare_single(
             name=request.domain,
             record_type=RecordType(request.record_type),
         )
-        return await engine.compare_single(query)
+        return ModelResponse(await engine.compare_single(query))
     finally:
         await target_client.disconnect()
 
@@ -80,7 +81,7 @@ async def compare_bulk(
             DNSQuery(name=d, record_type=RecordType(request.record_type))
             for d in request.domains
         ]
-        return await engine.compare_bulk(queries)
+        return ModelResponse(await engine.compare_bulk(queries))
     finally:
         await target_client.disconnect()
 
@@ -125,7 +126,7 @@ async def stop_shadow_mode():
 
     report = await _shadow_mode.stop()
     _shadow_mode = None
-    return report
+    return ModelResponse(report)
 
 
 @router.get("/shadow/report")
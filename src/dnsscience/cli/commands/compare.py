@@ -26,10 +26,8 @@ async def run_compare(
     source_client = CoreDNSClient(host="localhost", port=53)
     target_client = CoreDNSClient(host="localhost", port=5353)  # Different port for target
 
-    await source_client.connect()
-    await target_client.connect()
-
-    try:
+    # Both clients stay open for the whole batch so their query pools are reused
+    async with source_client, target_client:
         engine = CompareEngine(source_client, target_client)
 
         if queries_file:
@@ -63,10 +61,6 @@ async def run_compare(
         else:
             console.print("\n[bold red]Migration Readiness: NOT READY[/]")
 
-    finally:
-        await source_client.disconnect()
-        await target_client.disconnect()
-
 
 async def shadow(
     source: str,
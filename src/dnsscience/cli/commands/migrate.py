@@ -88,7 +88,7 @@ forward-zone:
             if m.requires_manual:
                 supported = "[yellow]Manual[/]"
             table.add_row(
-                m.coredns_plugin,
+                m.coredns_plugin or "N/A",
                 m.unbound_feature or "N/A",
                 supported,
                 m.notes[:50] + "..." if len(m.notes) > 50 else m.notes,
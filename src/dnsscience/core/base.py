@@ -1,5 +1,6 @@
 """Abstract base classes defining resolver interfaces."""
 
+import difflib
 from abc import ABC, abstractmethod
 from typing import AsyncIterator
 
@@ -25,6 +26,10 @@ class BaseResolverClient(ABC):
     """Abstract base class for DNS resolver clients."""
 
     resolver_type: ResolverType
+    config_path: str
+
+    # Clients with a local answer cache only consult it while this is set
+    use_cache: bool = True
 
     @abstractmethod
     async def connect(self) -> None:
@@ -36,6 +41,13 @@ class BaseResolverClient(ABC):
         """Close connection to the resolver."""
         ...
 
+    async def __aenter__(self) -> "BaseResolverClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.disconnect()
+
     # ========================================================================
     # Service Control
     # ========================================================================
@@ -130,10 +142,30 @@ class BaseResolverClient(ABC):
         """Validate configuration syntax and semantics."""
         ...
 
-    @abstractmethod
     async def diff_config(self, new_config: str) -> ConfigDiff:
         """Diff new config against running config."""
-        ...
+        current = await self.get_config()
+
+        # Line-based diff, keeping file order and repeated lines
+        current_lines = current.strip().splitlines()
+        new_lines = new_config.strip().splitlines()
+
+        additions: list[str] = []
+        deletions: list[str] = []
+        matcher = difflib.SequenceMatcher(None, current_lines, new_lines, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag in ("delete", "replace"):
+                deletions.extend(current_lines[i1:i2])
+            if tag in ("insert", "replace"):
+                additions.extend(new_lines[j1:j2])
+
+        return ConfigDiff(
+            source_path=self.config_path,
+            target_path="<new>",
+            additions=additions,
+            deletions=deletions,
+            is_different=current_lines != new_lines,
+        )
 
     @abstractmethod
     async def apply_config(self, config: str, reload: bool = True) -> ServiceControlResult:
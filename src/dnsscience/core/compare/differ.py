@@ -1,12 +1,18 @@
 """Response diffing logic for DNS comparison."""
 
+from typing import Any
+
 from dnsscience.core.models import (
     DNSRecord,
     DNSResponse,
     RecordDiff,
+    RecordType,
     ResponseDiff,
 )
 
+# Normalized (name, record type, value) used to pair up records
+RecordKey = tuple[str, RecordType, str]
+
 
 class ResponseDiffer:
     """
@@ -36,10 +42,17 @@ class ResponseDiffer:
         rcode_match = source.rcode == target.rcode
         record_count_match = len(source.records) == len(target.records)
 
-        # Compare records
-        record_diffs, missing_source, missing_target = self._compare_records(
-            source.records, target.records
-        )
+        # Compare records; identical record lists match under every option,
+        # so only differing ones need the keyed comparison
+        record_diffs: list[RecordDiff]
+        missing_source: list[DNSRecord]
+        missing_target: list[DNSRecord]
+        if source is target or source.records == target.records:
+            record_diffs, missing_source, missing_target = [], [], []
+        else:
+            record_diffs, missing_source, missing_target = self._compare_records(
+                source.records, target.records
+            )
 
         records_match = len(record_diffs) == 0 and len(missing_source) == 0 and len(missing_target) == 0
 
@@ -49,7 +62,8 @@ class ResponseDiffer:
         # Timing difference
         timing_diff = target.query_time_ms - source.query_time_ms
 
-        return ResponseDiff(
+        # Both responses are validated models, so skip revalidation
+        return ResponseDiff.model_construct(
             query=source.query,
             match=match,
             rcode_match=rcode_match,
@@ -66,74 +80,70 @@ class ResponseDiffer:
     def _compare_records(
         self, source_records: list[DNSRecord], target_records: list[DNSRecord]
     ) -> tuple[list[RecordDiff], list[DNSRecord], list[DNSRecord]]:
-        """Compare record lists and identify differences."""
+        """Compare record lists and identify differences.
+
+        Records are bucketed by normalized key, so the diff is linear in the
+        number of records. Duplicate records are matched one-for-one.
+        """
         diffs: list[RecordDiff] = []
         missing_in_source: list[DNSRecord] = []
         missing_in_target: list[DNSRecord] = []
 
-        # Normalize records for comparison
-        source_normalized = {self._record_key(r): r for r in source_records}
-        target_normalized = {self._record_key(r): r for r in target_records}
-
-        source_keys = set(source_normalized.keys())
-        target_keys = set(target_normalized.keys())
-
-        # Records only in source
-        for key in source_keys - target_keys:
-            missing_in_target.append(source_normalized[key])
-
-        # Records only in target
-        for key in target_keys - source_keys:
-            missing_in_source.append(target_normalized[key])
-
-        # Records in both - check for value differences
-        for key in source_keys & target_keys:
-            source_rec = source_normalized[key]
-            target_rec = target_normalized[key]
-
-            # Compare TTL if not ignored
-            if not self.ignore_ttl:
-                ttl_diff = abs(source_rec.ttl - target_rec.ttl)
-                if ttl_diff > self.ttl_tolerance:
-                    diffs.append(
-                        RecordDiff(
-                            field="ttl",
-                            source_value=source_rec.ttl,
-                            target_value=target_rec.ttl,
+        source_by_key = self._group_records(source_records)
+        target_by_key = self._group_records(target_records)
+        check_ttl = not self.ignore_ttl
+
+        for key, source_group in source_by_key.items():
+            target_group = target_by_key.get(key, ())
+
+            # Records only in source (or surplus duplicates)
+            missing_in_target.extend(source_group[len(target_group):])
+
+            # Records in both - the key already covers name, type and value
+            if check_ttl:
+                # Surplus duplicates on either side were handled above
+                for source_rec, target_rec in zip(source_group, target_group, strict=False):
+                    if abs(source_rec.ttl - target_rec.ttl) > self.ttl_tolerance:
+                        diffs.append(
+                            RecordDiff.model_construct(
+                                field="ttl",
+                                source_value=source_rec.ttl,
+                                target_value=target_rec.ttl,
+                            )
                         )
-                    )
-
-            # Compare values (already matched by key, but check for subtle differences)
-            source_val = self._normalize_value(source_rec.value)
-            target_val = self._normalize_value(target_rec.value)
-            if source_val != target_val:
-                diffs.append(
-                    RecordDiff(
-                        field="value",
-                        source_value=source_rec.value,
-                        target_value=target_rec.value,
-                    )
-                )
+
+        # Records only in target (or surplus duplicates)
+        for key, target_group in target_by_key.items():
+            missing_in_source.extend(target_group[len(source_by_key.get(key, ())):])
 
         return diffs, missing_in_source, missing_in_target
 
-    def _record_key(self, record: DNSRecord) -> tuple:
-        """Generate a comparison key for a record."""
-        name = record.name.lower() if self.ignore_case else record.name
-        name = name.rstrip(".")  # Normalize trailing dot
-        value = self._normalize_value(record.value)
+    def _group_records(self, records: list[DNSRecord]) -> dict[RecordKey, list[DNSRecord]]:
+        """Bucket records by comparison key, preserving order."""
+        groups: dict[RecordKey, list[DNSRecord]] = {}
+        for key, record in zip(self._record_keys(records), records, strict=True):
+            groups.setdefault(key, []).append(record)
+        return groups
 
-        return (name, record.record_type, value)
+    def _record_keys(self, records: list[DNSRecord]) -> list[RecordKey]:
+        """Comparison keys for a record list, built in one pass.
 
-    def _normalize_value(self, value: str) -> str:
-        """Normalize a record value for comparison."""
-        value = value.strip()
+        Names and values are case-folded (unless ignore_case is off) and
+        lose a trailing dot; values are also stripped of whitespace.
+        """
         if self.ignore_case:
-            value = value.lower()
-        # Normalize trailing dots in domain names
-        if value.endswith("."):
-            value = value[:-1]
-        return value
+            return [
+                (
+                    r.name.lower().rstrip("."),
+                    r.record_type,
+                    r.value.strip().lower().removesuffix("."),
+                )
+                for r in records
+            ]
+        return [
+            (r.name.rstrip("."), r.record_type, r.value.strip().removesuffix("."))
+            for r in records
+        ]
 
 
 class RecordSetDiffer:
@@ -148,7 +158,7 @@ class RecordSetDiffer:
         self,
         source_records: list[DNSRecord],
         target_records: list[DNSRecord],
-    ) -> dict:
+    ) -> dict[str, Any]:
         """Compare two complete zone record sets."""
         diffs, missing_source, missing_target = self.differ._compare_records(
             source_records, target_records
@@ -28,11 +28,17 @@ class CompareEngine:
         target_client: BaseResolverClient,
         timeout: float = 5.0,
         retries: int = 3,
+        max_concurrency: int = 64,
     ):
         self.source = source_client
         self.target = target_client
+        # Compare live answers, not whatever a client cached earlier
+        source_client.use_cache = False
+        target_client.use_cache = False
         self.timeout = timeout
         self.retries = retries
+        # A zero or negative cap would deadlock bulk comparisons
+        self.max_concurrency = max(1, max_concurrency)
         self.differ = ResponseDiffer()
 
     async def compare_single(self, query: DNSQuery) -> ResponseDiff:
@@ -57,37 +63,55 @@ class CompareEngine:
         """Compare multiple queries between resolvers."""
         start_time = datetime.utcnow()
 
-        # Run all comparisons concurrently
-        tasks = [self.compare_single(q) for q in queries]
-        diffs = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        valid_diffs: list[ResponseDiff] = []
+        # Run comparisons concurrently, capped so large query sets don't
+        # flood either resolver with outstanding requests
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(
+            index: int, query: DNSQuery
+        ) -> tuple[int, ResponseDiff | Exception]:
+            async with semaphore:
+                try:
+                    return index, await self.compare_single(query)
+                except Exception as e:
+                    return index, e
+
+        # Tally results as they complete; only mismatches are kept, so
+        # matching responses can be released straight away
+        mismatched: list[tuple[int, ResponseDiff]] = []
+        compared = 0
         matches = 0
         mismatches = 0
         total_timing_diff = 0.0
 
-        for diff in diffs:
+        for next_done in asyncio.as_completed(
+            [bounded(i, q) for i, q in enumerate(queries)]
+        ):
+            index, diff = await next_done
             if isinstance(diff, Exception):
                 # Treat exceptions as mismatches
                 mismatches += 1
                 continue
 
-            valid_diffs.append(diff)
+            compared += 1
+            total_timing_diff += abs(diff.timing_diff_ms)
             if diff.match:
                 matches += 1
             else:
                 mismatches += 1
-            total_timing_diff += abs(diff.timing_diff_ms)
+                mismatched.append((index, diff))
+
+        # Report mismatches in query order
+        mismatched.sort(key=lambda item: item[0])
 
         total = matches + mismatches
         match_ratio = matches / total if total > 0 else 0.0
-        avg_timing_diff = total_timing_diff / len(valid_diffs) if valid_diffs else 0.0
+        avg_timing_diff = total_timing_diff / compared if compared else 0.0
 
         # Calculate confidence score
         confidence = self._calculate_confidence(match_ratio, avg_timing_diff, len(queries))
 
-        return CompareResult(
+        return CompareResult.model_construct(
             source=self.source.resolver_type,
             target=self.target.resolver_type,
             queries_tested=len(queries),
@@ -95,7 +119,7 @@ class CompareEngine:
             mismatches=mismatches,
             match_ratio=match_ratio,
             avg_timing_diff_ms=avg_timing_diff,
-            diffs=[d for d in valid_diffs if not d.match],  # Only include mismatches
+            diffs=[diff for _, diff in mismatched],
             confidence_score=confidence,
             timestamp=start_time,
         )
@@ -131,7 +155,7 @@ class CompareEngine:
         self, query: DNSQuery, resolver: ResolverType, error: Exception
     ) -> DNSResponse:
         """Create an error response for failed queries."""
-        return DNSResponse(
+        return DNSResponse.model_construct(
             query=query,
             records=[],
             rcode="SERVFAIL",
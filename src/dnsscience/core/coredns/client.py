@@ -1,8 +1,11 @@
 """CoreDNS client implementation."""
 
 import asyncio
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import AsyncIterator
+from functools import partial
+from typing import AsyncIterator, TypeVar
 
 import dns.message
 import dns.query
@@ -15,7 +18,6 @@ from dnsscience.core.models import (
     CacheEntry,
     CachePurgeResult,
     CacheStats,
-    ConfigDiff,
     ConfigValidationResult,
     DNSQuery,
     DNSRecord,
@@ -32,12 +34,17 @@ from dnsscience.core.models import (
     UpstreamHealth,
 )
 
+T = TypeVar("T")
+
 
 class CoreDNSClient(BaseResolverClient):
     """Client for managing CoreDNS instances."""
 
     resolver_type = ResolverType.COREDNS
 
+    # Worker threads reserved for blocking dnspython queries
+    DNS_WORKERS = 32
+
     def __init__(
         self,
         host: str = "localhost",
@@ -53,15 +60,34 @@ class CoreDNSClient(BaseResolverClient):
         self.config_path = config_path
         self._http_client: httpx.AsyncClient | None = None
 
+        # Requests currently in flight, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        # Long-lived query workers, reused across bulk runs instead of
+        # competing with other to_thread work in the default executor
+        self._dns_pool: ThreadPoolExecutor | None = None
+
     async def connect(self) -> None:
         """Initialize HTTP client for metrics/health endpoints."""
-        self._http_client = httpx.AsyncClient(timeout=10.0)
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=10.0)
 
     async def disconnect(self) -> None:
-        """Close HTTP client."""
+        """Close HTTP client and query workers."""
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
+        if self._dns_pool is not None:
+            self._dns_pool.shutdown(wait=False, cancel_futures=True)
+            self._dns_pool = None
+
+    def _dns_executor(self) -> ThreadPoolExecutor:
+        """Return the DNS query pool, creating it on first use."""
+        if self._dns_pool is None:
+            self._dns_pool = ThreadPoolExecutor(
+                max_workers=self.DNS_WORKERS, thread_name_prefix="coredns-dns"
+            )
+        return self._dns_pool
 
     @property
     def http_client(self) -> httpx.AsyncClient:
@@ -69,12 +95,25 @@ class CoreDNSClient(BaseResolverClient):
             raise RuntimeError("Client not connected. Call connect() first.")
         return self._http_client
 
+    async def _single_flight(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fetch`` once for all concurrent callers using the same key."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
     # ========================================================================
     # Service Control
     # ========================================================================
 
     async def get_status(self) -> ServiceStatus:
         """Get CoreDNS service status via health and metrics endpoints."""
+        return await self._single_flight("status", self._fetch_status)
+
+    async def _fetch_status(self) -> ServiceStatus:
+        """Probe the health endpoint and read the version from metrics."""
         state = ServiceState.UNKNOWN
         version = None
         plugins: list[str] = []
@@ -183,37 +222,34 @@ class CoreDNSClient(BaseResolverClient):
             server = query.server or self.host
             port = query.port or self.port
 
-            if query.use_tcp:
-                response = await asyncio.to_thread(
-                    dns.query.tcp, msg, server, port=port, timeout=query.timeout
-                )
-            else:
-                response = await asyncio.to_thread(
-                    dns.query.udp, msg, server, port=port, timeout=query.timeout
-                )
+            send = dns.query.tcp if query.use_tcp else dns.query.udp
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._dns_executor(),
+                partial(send, msg, server, port=port, timeout=query.timeout),
+            )
 
             end_time = asyncio.get_event_loop().time()
             query_time_ms = (end_time - start_time) * 1000
 
-            # Parse records
+            # Parse records; fields are already typed, so skip per-record
+            # validation and convert the per-rrset values once
+            construct = DNSRecord.model_construct
             records: list[DNSRecord] = []
             for rrset in response.answer:
-                for rdata in rrset:
-                    records.append(
-                        DNSRecord(
-                            name=str(rrset.name),
-                            record_type=RecordType(dns.rdatatype.to_text(rrset.rdtype)),
-                            ttl=rrset.ttl,
-                            value=str(rdata),
-                        )
-                    )
+                name = str(rrset.name)
+                record_type = RecordType(dns.rdatatype.to_text(rrset.rdtype))
+                ttl = rrset.ttl
+                records.extend(
+                    construct(name=name, record_type=record_type, ttl=ttl, value=str(rdata))
+                    for rdata in rrset
+                )
 
             # Check DNSSEC
             dnssec_valid = None
             if query.dnssec:
                 dnssec_valid = bool(response.flags & dns.flags.AD)
 
-            return DNSResponse(
+            return DNSResponse.model_construct(
                 query=query,
                 records=records,
                 rcode=dns.rcode.to_text(response.rcode()),
@@ -357,22 +393,6 @@ class CoreDNSClient(BaseResolverClient):
         parser = CorefileParser()
         return parser.validate(config)
 
-    async def diff_config(self, new_config: str) -> ConfigDiff:
-        """Diff new config against current running config."""
-        current = await self.get_config()
-
-        # Simple line-based diff
-        current_lines = set(current.strip().split("\n"))
-        new_lines = set(new_config.strip().split("\n"))
-
-        return ConfigDiff(
-            source_path=self.config_path,
-            target_path="<new>",
-            additions=list(new_lines - current_lines),
-            deletions=list(current_lines - new_lines),
-            is_different=current_lines != new_lines,
-        )
-
     async def apply_config(self, config: str, reload: bool = True) -> ServiceControlResult:
         """Write new config and optionally trigger reload."""
         import aiofiles
@@ -436,6 +456,10 @@ class CoreDNSClient(BaseResolverClient):
 
     async def get_metrics(self) -> MetricsSnapshot:
         """Scrape Prometheus metrics from CoreDNS."""
+        return await self._single_flight("metrics", self._scrape_metrics)
+
+    async def _scrape_metrics(self) -> MetricsSnapshot:
+        """Fetch and parse the Prometheus metrics endpoint."""
         metrics: list[MetricValue] = []
 
         try:
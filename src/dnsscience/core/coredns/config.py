@@ -1,5 +1,6 @@
 """Corefile parser and generator for CoreDNS configuration."""
 
+import functools
 import re
 from dataclasses import dataclass, field
 from typing import Any
@@ -7,8 +8,11 @@ from typing import Any
 from dnsscience.core.base import BaseConfigGenerator, BaseConfigParser
 from dnsscience.core.models import ConfigValidationError, ConfigValidationResult, ResolverType
 
+# Server block declaration, e.g. ".:53 {" or "dns://example.com:5353"
+_SERVER_DECL_RE = re.compile(r"^([^\s{]+(?:\s+[^\s{]+)*)\s*{?\s*$")
 
-@dataclass
+
+@dataclass(slots=True)
 class CorefilePlugin:
     """Represents a plugin block in a Corefile."""
 
@@ -18,7 +22,7 @@ class CorefilePlugin:
     raw_block: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CorefileServer:
     """Represents a server block in a Corefile."""
 
@@ -28,7 +32,7 @@ class CorefileServer:
     plugins: list[CorefilePlugin] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CorefileConfig:
     """Parsed Corefile configuration."""
 
@@ -90,7 +94,15 @@ class CorefileParser(BaseConfigParser):
     }
 
     def parse(self, config_text: str) -> CorefileConfig:
-        """Parse Corefile text into structured configuration."""
+        """Parse Corefile text into structured configuration.
+
+        Results are memoized per Corefile text; each call returns its own
+        copy, so callers may modify it freely.
+        """
+        return _copy_config(_cached_parse(type(self), config_text))
+
+    def _parse(self, config_text: str) -> CorefileConfig:
+        """Parse Corefile text without consulting the cache."""
         config = CorefileConfig(raw=config_text)
         lines = config_text.split("\n")
 
@@ -127,9 +139,9 @@ class CorefileParser(BaseConfigParser):
                 i += 1
                 continue
 
-            # Handle server block start
-            server_match = re.match(r"^([^\s{]+(?:\s+[^\s{]+)*)\s*{?\s*$", line)
-            if server_match and brace_depth == 0:
+            # Handle server block start (only possible at the top level)
+            server_match = brace_depth == 0 and _SERVER_DECL_RE.match(line)
+            if server_match:
                 # Parse zones and port from server declaration
                 server_decl = server_match.group(1)
                 zones, port, protocol = self._parse_server_declaration(server_decl)
@@ -235,7 +247,11 @@ class CorefileParser(BaseConfigParser):
         return CorefilePlugin(name=name, args=args)
 
     def validate(self, config_text: str) -> ConfigValidationResult:
-        """Validate Corefile syntax and common issues."""
+        """Validate Corefile syntax and common issues (memoized like parse)."""
+        return _copy_validation(_cached_validate(type(self), config_text))
+
+    def _validate(self, config_text: str) -> ConfigValidationResult:
+        """Validate Corefile text without consulting the cache."""
         errors: list[ConfigValidationError] = []
         warnings: list[ConfigValidationError] = []
 
@@ -275,9 +291,9 @@ class CorefileParser(BaseConfigParser):
                 )
             )
 
-        # Try to parse
+        # Try to parse (the result is discarded, so skip parse()'s copy)
         try:
-            self.parse(config_text)
+            _cached_parse(type(self), config_text)
         except Exception as e:
             errors.append(
                 ConfigValidationError(
@@ -318,6 +334,57 @@ class CorefileParser(BaseConfigParser):
         }
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_parse(parser_cls: type[CorefileParser], config_text: str) -> CorefileConfig:
+    return parser_cls()._parse(config_text)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_validate(
+    parser_cls: type[CorefileParser], config_text: str
+) -> ConfigValidationResult:
+    return parser_cls()._validate(config_text)
+
+
+def _copy_config(config: CorefileConfig) -> CorefileConfig:
+    """Copy a parsed Corefile down to its lists and dicts.
+
+    Much cheaper than copy.deepcopy; the leaves are all strings and ints.
+    """
+    return CorefileConfig(
+        servers=[
+            CorefileServer(
+                zones=list(s.zones),
+                port=s.port,
+                protocol=s.protocol,
+                plugins=[
+                    CorefilePlugin(
+                        name=p.name,
+                        args=list(p.args),
+                        block=dict(p.block),
+                        raw_block=p.raw_block,
+                    )
+                    for p in s.plugins
+                ],
+            )
+            for s in config.servers
+        ],
+        imports=list(config.imports),
+        snippets=dict(config.snippets),
+        raw=config.raw,
+    )
+
+
+def _copy_validation(result: ConfigValidationResult) -> ConfigValidationResult:
+    """Copy a validation result along with its error and warning entries."""
+    return result.model_copy(
+        update={
+            "errors": [e.model_copy() for e in result.errors],
+            "warnings": [w.model_copy() for w in result.warnings],
+        }
+    )
+
+
 class CorefileGenerator(BaseConfigGenerator):
     """Generator for CoreDNS Corefile configuration."""
 
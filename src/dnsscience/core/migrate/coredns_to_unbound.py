@@ -1,5 +1,7 @@
 """CoreDNS to Unbound migration logic."""
 
+import functools
+
 from dnsscience.core.coredns.config import CorefileParser
 from dnsscience.core.models import (
     MigrationStep,
@@ -126,7 +128,7 @@ class CoreDNSToUnboundMigrator:
         ),
     }
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.parser = CorefileParser()
 
     def analyze_config(self, config: str) -> tuple[list[PluginMapping], list[str], list[str]]:
@@ -169,7 +171,19 @@ class CoreDNSToUnboundMigrator:
         return mappings, warnings, unsupported
 
     def generate_target_config(self, source_config: str) -> str:
-        """Generate Unbound configuration from CoreDNS Corefile."""
+        """Generate Unbound configuration from CoreDNS Corefile.
+
+        Output is memoized per source config text.
+        """
+        return self._cached_target_config(source_config)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _cached_target_config(source_config: str) -> str:
+        return CoreDNSToUnboundMigrator()._generate_target_config(source_config)
+
+    def _generate_target_config(self, source_config: str) -> str:
+        """Generate the target config without consulting the cache."""
         parsed = self.parser.parse(source_config)
 
         lines = [
@@ -344,3 +358,4 @@ class CoreDNSToUnboundMigrator:
         ]
 
         return steps
+
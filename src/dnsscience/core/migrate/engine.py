@@ -96,7 +96,9 @@ class MigrationEngine:
         # Estimate risk
         risk = self._estimate_risk(mappings, unsupported, len(steps))
 
-        plan = MigrationPlan(
+        # Everything here comes from the migrator already typed, so skip
+        # re-validating it; created_at still comes from its default factory
+        plan = MigrationPlan.model_construct(
             source=self.migrator.source_type,
             target=self.migrator.target_type,
             steps=steps,
@@ -107,7 +109,7 @@ class MigrationEngine:
         )
 
         # Initialize status
-        self._status = MigrationStatus(
+        self._status = MigrationStatus.model_construct(
             state=MigrationState.PLANNED,
             plan=plan,
             current_step=0,
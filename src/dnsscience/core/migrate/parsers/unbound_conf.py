@@ -6,6 +6,9 @@ from typing import Any
 from dnsscience.core.base import BaseConfigParser
 from dnsscience.core.models import ConfigValidationError, ConfigValidationResult
 
+# One stripped config line: "name:" opens a section, "name: value" is an option
+_LINE_RE = re.compile(r"([a-z-]+):\s*(.*)")
+
 
 class UnboundConfigParser(BaseConfigParser):
     """
@@ -169,29 +172,32 @@ class UnboundConfigParser(BaseConfigParser):
         current_section: str | None = None
         current_section_data: dict[str, Any] = {}
 
-        lines = config_text.split("\n")
+        strip_comment = self._strip_comment
+        match_line = _LINE_RE.fullmatch
 
-        for line in lines:
-            line = self._strip_comment(line).strip()
+        for line in config_text.split("\n"):
+            line = strip_comment(line).strip()
             if not line:
                 continue
 
-            # Check for section header
-            section_match = re.match(r"^([a-z-]+):$", line)
-            if section_match:
+            line_match = match_line(line)
+            if line_match is None:
+                continue
+            key, value = line_match.groups()
+
+            # Section header: nothing after the colon
+            if not value:
                 # Save previous section
                 if current_section:
                     self._add_section(result, current_section, current_section_data)
 
-                current_section = section_match.group(1)
+                current_section = key
                 current_section_data = {}
                 continue
 
             # Parse key-value pair
-            kv_match = re.match(r"^\s*([a-z-]+):\s*(.*)$", line)
-            if kv_match and current_section:
-                key = kv_match.group(1)
-                value = kv_match.group(2).strip().strip('"')
+            if current_section:
+                value = value.strip('"')
 
                 # Handle multi-value keys
                 if key in current_section_data:
@@ -246,10 +252,11 @@ class UnboundConfigParser(BaseConfigParser):
             if not line:
                 continue
 
+            line_match = _LINE_RE.fullmatch(line)
+
             # Check section header
-            section_match = re.match(r"^([a-z-]+):$", line)
-            if section_match:
-                section_name = section_match.group(1)
+            if line_match and not line_match.group(2):
+                section_name = line_match.group(1)
                 if section_name not in self.KNOWN_SECTIONS:
                     warnings.append(
                         ConfigValidationError(
@@ -262,9 +269,8 @@ class UnboundConfigParser(BaseConfigParser):
                 continue
 
             # Check key-value pairs
-            kv_match = re.match(r"^\s*([a-z-]+):\s*(.*)$", line)
-            if kv_match:
-                key = kv_match.group(1)
+            if line_match:
+                key = line_match.group(1)
                 if current_section == "server" and key not in self.KNOWN_SERVER_OPTIONS:
                     warnings.append(
                         ConfigValidationError(
@@ -1,5 +1,7 @@
 """Unbound to CoreDNS migration logic."""
 
+import functools
+
 from dnsscience.core.coredns.config import CorefileGenerator
 from dnsscience.core.models import (
     MigrationStep,
@@ -98,7 +100,7 @@ class UnboundToCoreDNSMigrator:
         ),
     }
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.parser = UnboundConfigParser()
         self.generator = CorefileGenerator()
 
@@ -138,7 +140,19 @@ class UnboundToCoreDNSMigrator:
         return mappings, warnings, unsupported
 
     def generate_target_config(self, source_config: str) -> str:
-        """Generate CoreDNS Corefile from Unbound configuration."""
+        """Generate CoreDNS Corefile from Unbound configuration.
+
+        Output is memoized per source config text.
+        """
+        return self._cached_target_config(source_config)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _cached_target_config(source_config: str) -> str:
+        return UnboundToCoreDNSMigrator()._generate_target_config(source_config)
+
+    def _generate_target_config(self, source_config: str) -> str:
+        """Generate the target config without consulting the cache."""
         parsed = self.parser.parse(source_config)
 
         # Build config dict for generator
@@ -290,3 +304,4 @@ class UnboundToCoreDNSMigrator:
         ]
 
         return steps
+
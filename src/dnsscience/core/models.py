@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ResolverType(str, Enum):
@@ -75,6 +75,8 @@ class MigrationState(str, Enum):
 class DNSQuery(BaseModel):
     """DNS query request."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Domain name to query")
     record_type: RecordType = Field(default=RecordType.A, description="Record type")
     server: str | None = Field(default=None, description="DNS server to query")
@@ -87,6 +89,8 @@ class DNSQuery(BaseModel):
 class DNSRecord(BaseModel):
     """Single DNS record."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     record_type: RecordType
     ttl: int
@@ -337,7 +341,7 @@ class ConfigDiff(BaseModel):
 class PluginMapping(BaseModel):
     """Mapping between CoreDNS plugin and Unbound equivalent."""
 
-    coredns_plugin: str
+    coredns_plugin: str | None
     unbound_feature: str | None
     notes: str
     supported: bool
@@ -1,12 +1,25 @@
 """Unbound client implementation."""
 
 import asyncio
+import contextlib
+import os
+import re
+import shutil
+import ssl
+import stat
 import subprocess
+import tempfile
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import AsyncIterator
+from functools import lru_cache, partial
+from typing import Any
 
+import dns.flags
 import dns.message
 import dns.query
+import dns.rcode
 import dns.rdatatype
 
 from dnsscience.core.base import BaseResolverClient
@@ -15,7 +28,7 @@ from dnsscience.core.models import (
     CacheEntry,
     CachePurgeResult,
     CacheStats,
-    ConfigDiff,
+    ConfigValidationError,
     ConfigValidationResult,
     DNSQuery,
     DNSRecord,
@@ -32,6 +45,67 @@ from dnsscience.core.models import (
     UpstreamHealth,
 )
 
+# One "key=value" line of unbound-control stats output
+_STAT_LINE_RE = re.compile(r"^\s*([\w.\-]+)\s*=\s*(\S*)\s*$", re.MULTILINE)
+
+# stats_noreset keys feeding CacheStats, mapped to the field they add to
+_CACHE_STAT_FIELDS = {
+    "total.num.cachehits": "hits",
+    "total.num.cachemiss": "misses",
+    "msg.cache.count": "size",
+    "rrset.cache.count": "size",
+}
+
+# Header flag bits in dns.flags.to_text() order
+_FLAG_BITS = tuple((int(flag), flag.name) for flag in dns.flags.Flag)
+
+
+@lru_cache(maxsize=8)
+def _executable(name: str) -> str:
+    """Resolve a binary to an absolute path, keeping the name if not on PATH."""
+    return shutil.which(name) or name
+
+
+async def _exec(*cmd: str, **kwargs: Any) -> asyncio.subprocess.Process:
+    """
+    Start a subprocess on CPython's posix_spawn fast path.
+
+    Popen only uses posix_spawn instead of fork+exec (which copies the
+    interpreter's page tables) for an absolute executable with close_fds
+    off. Python opens its own fds non-inheritable, so nothing leaks.
+    """
+    return await asyncio.create_subprocess_exec(*cmd, close_fds=False, **kwargs)
+
+
+@lru_cache(maxsize=1024)
+def _metric_name(key: str) -> str:
+    """Map a stats key (e.g. ``total.num.queries``) to its metric name."""
+    return "unbound_" + key.replace(".", "_")
+
+
+@lru_cache(maxsize=64)
+def _rcode_text(rcode: int) -> str:
+    """Map a numeric rcode to its mnemonic."""
+    return dns.rcode.to_text(rcode)
+
+
+@lru_cache(maxsize=256)
+def _rdtype_from_record_type(record_type: RecordType) -> int:
+    """Map a RecordType to its dnspython rdatatype."""
+    return dns.rdatatype.from_text(record_type.value)
+
+
+@lru_cache(maxsize=256)
+def _record_type_from_rdtype(rdtype: int) -> RecordType:
+    """Map a dnspython rdatatype back to a RecordType."""
+    return RecordType(dns.rdatatype.to_text(rdtype))
+
+
+@lru_cache(maxsize=256)
+def _record_type_from_text(text: str) -> RecordType:
+    """Map a record type mnemonic (e.g. from dump_cache) to a RecordType."""
+    return RecordType(text)
+
 
 class UnboundClient(BaseResolverClient):
     """
@@ -43,6 +117,15 @@ class UnboundClient(BaseResolverClient):
 
     resolver_type = ResolverType.UNBOUND
 
+    # unbound-control commands that run locally instead of on the server
+    LOCAL_CONTROL_COMMANDS = frozenset({"start"})
+
+    # Seconds a status reading is reused before asking the server again
+    STATUS_TTL = 2.0
+
+    # Worker threads reserved for blocking dnspython queries
+    DNS_WORKERS = 32
+
     def __init__(
         self,
         host: str = "localhost",
@@ -50,14 +133,48 @@ class UnboundClient(BaseResolverClient):
         control_port: int = 8953,
         config_path: str = "/etc/unbound/unbound.conf",
         control_path: str = "/usr/sbin/unbound-control",
+        control_use_cert: bool = True,
+        control_cert_dir: str = "/etc/unbound",
+        cache_max_entries: int = 1024,
+        bulk_concurrency: int = 64,
+        use_cache: bool = True,
     ):
         self.host = host
         self.port = port
         self.control_port = control_port
         self.config_path = config_path
         self.control_path = control_path
+        self.control_use_cert = control_use_cert
+        self.control_cert_dir = control_cert_dir
         self._connected = False
 
+        # Talk to the control port directly; falls back to the binary on TLS errors
+        self._ctl_direct = True
+        self._ctl_ssl: ssl.SSLContext | None = None
+
+        # Last status seen or implied by a successful control command
+        self._last_status: ServiceStatus | None = None
+
+        # unbound-checkconf can read the config from a pipe on Linux
+        self._checkconf_stdin = os.path.exists("/dev/stdin")
+
+        # Response cache: key -> (expiry, stored at, response), loop time, LRU ordered
+        self._cache: OrderedDict[tuple, tuple[float, float, DNSResponse]] = OrderedDict()
+        self._cache_max = cache_max_entries
+        self.use_cache = use_cache
+
+        # Upper bound on in-flight queries during query_bulk
+        self._bulk_concurrency = bulk_concurrency
+
+        # Dedicated pool so queries don't queue behind file/subprocess to_thread work
+        self._dns_pool: ThreadPoolExecutor | None = None
+
+        # unbound-control memo: args -> (start time, in-flight or finished task)
+        self._ctl_cache: dict[
+            tuple[str, ...], tuple[float, asyncio.Task[tuple[str, str, int]]]
+        ] = {}
+        self._stats_parsed: tuple[str, dict[str, str]] | None = None
+
     async def connect(self) -> None:
         """Verify unbound-control is accessible."""
         self._connected = True
@@ -65,19 +182,179 @@ class UnboundClient(BaseResolverClient):
     async def disconnect(self) -> None:
         """Close any connections."""
         self._connected = False
+        if self._dns_pool is not None:
+            self._dns_pool.shutdown(wait=False, cancel_futures=True)
+            self._dns_pool = None
+
+    def _dns_executor(self) -> ThreadPoolExecutor:
+        """Return the DNS query pool, creating it on first use."""
+        if self._dns_pool is None:
+            self._dns_pool = ThreadPoolExecutor(
+                max_workers=self.DNS_WORKERS, thread_name_prefix="unbound-dns"
+            )
+        return self._dns_pool
+
+    async def _run_control(self, *args: str, ttl: float = 0.0) -> tuple[str, str, int]:
+        """
+        Run unbound-control command.
+
+        With ``ttl`` > 0 the result is shared with concurrent callers and
+        reused for ``ttl`` seconds. Uncached commands (start, stop, flush...)
+        may change resolver state, so they invalidate the memo.
+        """
+        if ttl <= 0:
+            self._ctl_cache.clear()
+            return await self._call_control(*args)
+
+        now = asyncio.get_event_loop().time()
+        entry = self._ctl_cache.get(args)
+        if entry is None or (entry[1].done() and now - entry[0] >= ttl):
+            task = asyncio.create_task(self._call_control(*args))
+            self._ctl_cache[args] = (now, task)
+        else:
+            task = entry[1]
 
-    async def _run_control(self, *args: str) -> tuple[str, str, int]:
-        """Run unbound-control command."""
-        cmd = [self.control_path, "-s", f"{self.host}@{self.control_port}"] + list(args)
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            current = self._ctl_cache.get(args)
+            if current is not None and current[1] is task:
+                del self._ctl_cache[args]
+            raise
+
+    async def _call_control(self, *args: str) -> tuple[str, str, int]:
+        """Send a control command, preferring the direct control channel."""
+        if self._ctl_direct and args[0] not in self.LOCAL_CONTROL_COMMANDS:
+            try:
+                reader, writer = await self._open_control_connection()
+            except OSError:
+                # Unusable certificates or nothing listening - let
+                # unbound-control handle (and report) it
+                pass
+            else:
+                return await self._send_control(reader, writer, *args)
+
+        return await self._spawn_control(*args)
+
+    def _control_ssl_context(self) -> ssl.SSLContext:
+        """
+        Build (once) the client TLS context for the control port.
+
+        Certificates that can't be loaded (missing, unreadable, invalid)
+        switch the client to unbound-control for good.
+        """
+        if self._ctl_ssl is None:
+            try:
+                ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+                # Unbound's self-signed server cert is pinned, not matched by hostname
+                ctx.check_hostname = False
+                ctx.load_verify_locations(
+                    os.path.join(self.control_cert_dir, "unbound_server.pem")
+                )
+                ctx.load_cert_chain(
+                    os.path.join(self.control_cert_dir, "unbound_control.pem"),
+                    os.path.join(self.control_cert_dir, "unbound_control.key"),
+                )
+            except OSError:
+                self._ctl_direct = False
+                raise
+            self._ctl_ssl = ctx
+        return self._ctl_ssl
+
+    async def _open_control_connection(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Connect to the control interface (TLS unless disabled or a unix socket)."""
+        if self.host.startswith("/"):
+            return await asyncio.open_unix_connection(self.host)
+
+        ssl_ctx = self._control_ssl_context() if self.control_use_cert else None
+        try:
+            return await asyncio.open_connection(self.host, self.control_port, ssl=ssl_ctx)
+        except ssl.SSLError:
+            # Handshake rejected; unbound-control may use different credentials
+            self._ctl_direct = False
+            raise
+
+    async def _close_control_connection(self, writer: asyncio.StreamWriter) -> None:
+        """Close a control connection, ignoring errors from a peer that already hung up."""
+        writer.close()
+        with contextlib.suppress(ssl.SSLError, OSError):
+            await writer.wait_closed()
+
+    async def _send_control(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, *args: str
+    ) -> tuple[str, str, int]:
+        """
+        Run a command over Unbound's remote-control protocol.
+
+        Avoids forking unbound-control for every call. The server answers a
+        single ``UBCT1 <command>`` per connection and then closes it.
+        """
+        try:
+            writer.write(f"UBCT1 {' '.join(args)}\n".encode())
+            await writer.drain()
+            output = (await reader.read()).decode()
+        finally:
+            await self._close_control_connection(writer)
 
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
+        # Same convention as unbound-control: an "error" reply exits non-zero
+        if output.startswith("error"):
+            return output, output, 1
+        return output, "", 0
+
+    def _control_cmd(self, *args: str) -> list[str]:
+        """Build the unbound-control command line."""
+        return [_executable(self.control_path), "-s", f"{self.host}@{self.control_port}", *args]
+
+    async def _spawn_control(self, *args: str) -> tuple[str, str, int]:
+        """Spawn unbound-control and collect its output."""
+        proc = await _exec(
+            *self._control_cmd(*args),
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
         stdout, stderr = await proc.communicate()
         return stdout.decode(), stderr.decode(), proc.returncode or 0
 
+    async def _stream_control(self, *args: str) -> AsyncGenerator[bytes, None]:
+        """
+        Yield the raw output lines of a control command as they arrive.
+
+        Used for potentially huge outputs like ``dump_cache``. Stopping
+        iteration early closes the connection (or terminates unbound-control)
+        so the rest of the output is never read.
+        """
+        if self._ctl_direct:
+            try:
+                reader, writer = await self._open_control_connection()
+            except OSError:
+                pass
+            else:
+                try:
+                    writer.write(f"UBCT1 {' '.join(args)}\n".encode())
+                    await writer.drain()
+                    async for line in reader:
+                        yield line
+                finally:
+                    await self._close_control_connection(writer)
+                return
+
+        proc = await _exec(
+            *self._control_cmd(*args),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            assert proc.stdout is not None
+            async for line in proc.stdout:
+                yield line
+        finally:
+            if proc.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.terminate()
+            await proc.wait()
+
     # ========================================================================
     # Service Control
     # ========================================================================
@@ -89,7 +366,7 @@ class UnboundClient(BaseResolverClient):
         uptime = None
 
         try:
-            stdout, stderr, rc = await self._run_control("status")
+            stdout, stderr, rc = await self._run_control("status", ttl=self.STATUS_TTL)
 
             if rc == 0 and "is running" in stdout:
                 state = ServiceState.RUNNING
@@ -115,7 +392,7 @@ class UnboundClient(BaseResolverClient):
         except Exception:
             state = ServiceState.ERROR
 
-        return ServiceStatus(
+        self._last_status = ServiceStatus(
             resolver=ResolverType.UNBOUND,
             state=state,
             version=version,
@@ -124,24 +401,44 @@ class UnboundClient(BaseResolverClient):
             listening_addresses=[f"{self.host}:{self.port}"],
             modules=["validator", "iterator"],  # Default modules
         )
+        return self._last_status
+
+    async def _known_status(self) -> ServiceStatus:
+        """Return the last known status while fresh, otherwise query it."""
+        last = self._last_status
+        if last is not None:
+            age = (datetime.utcnow() - last.timestamp).total_seconds()
+            if age < self.STATUS_TTL:
+                return last
+        return await self.get_status()
+
+    def _assume_state(self, previous: ServiceStatus, state: ServiceState | None) -> None:
+        """Record the state implied by a control command (None = unknown)."""
+        if state is None:
+            self._last_status = None
+        else:
+            self._last_status = previous.model_copy(
+                update={"state": state, "timestamp": datetime.utcnow()}
+            )
 
     async def start(self) -> ServiceControlResult:
         """Start Unbound service."""
-        previous = await self.get_status()
+        previous = await self._known_status()
 
         try:
             stdout, stderr, rc = await self._run_control("start")
 
             if rc == 0:
-                current = await self.get_status()
+                self._assume_state(previous, ServiceState.RUNNING)
                 return ServiceControlResult(
                     action="start",
                     success=True,
                     message="Unbound started successfully",
                     previous_state=previous.state,
-                    current_state=current.state,
+                    current_state=ServiceState.RUNNING,
                 )
             else:
+                self._assume_state(previous, None)
                 return ServiceControlResult(
                     action="start",
                     success=False,
@@ -150,6 +447,7 @@ class UnboundClient(BaseResolverClient):
                     current_state=previous.state,
                 )
         except Exception as e:
+            self._assume_state(previous, None)
             return ServiceControlResult(
                 action="start",
                 success=False,
@@ -157,14 +455,18 @@ class UnboundClient(BaseResolverClient):
                 previous_state=previous.state,
                 current_state=previous.state,
             )
+        finally:
+            # Answers cached before the change may no longer hold
+            self.clear_query_cache()
 
     async def stop(self) -> ServiceControlResult:
         """Stop Unbound service."""
-        previous = await self.get_status()
+        previous = await self._known_status()
 
         try:
             stdout, stderr, rc = await self._run_control("stop")
 
+            self._assume_state(previous, ServiceState.STOPPED if rc == 0 else None)
             return ServiceControlResult(
                 action="stop",
                 success=rc == 0,
@@ -173,6 +475,7 @@ class UnboundClient(BaseResolverClient):
                 current_state=ServiceState.STOPPED if rc == 0 else previous.state,
             )
         except Exception as e:
+            self._assume_state(previous, None)
             return ServiceControlResult(
                 action="stop",
                 success=False,
@@ -180,6 +483,9 @@ class UnboundClient(BaseResolverClient):
                 previous_state=previous.state,
                 current_state=previous.state,
             )
+        finally:
+            # Answers cached before the change may no longer hold
+            self.clear_query_cache()
 
     async def restart(self) -> ServiceControlResult:
         """Restart Unbound service."""
@@ -187,16 +493,36 @@ class UnboundClient(BaseResolverClient):
         if not stop_result.success:
             return stop_result
 
-        await asyncio.sleep(1)  # Brief pause between stop and start
+        # Start as soon as the old process is gone instead of a fixed pause
+        await self._wait_for_state(ServiceState.STOPPED)
         return await self.start()
 
+    async def _wait_for_state(
+        self,
+        state: ServiceState,
+        timeout: float = 5.0,
+        interval: float = 0.05,
+    ) -> ServiceState:
+        """Poll the service until it reaches ``state`` or ``timeout`` expires."""
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+
+        while True:
+            # Each poll must hit the server, not the memoized status
+            self._ctl_cache.pop(("status",), None)
+            current = (await self.get_status()).state
+            if current == state or loop.time() >= deadline:
+                return current
+            await asyncio.sleep(interval)
+
     async def reload(self) -> ServiceControlResult:
         """Reload Unbound configuration."""
-        previous = await self.get_status()
+        previous = await self._known_status()
 
         try:
             stdout, stderr, rc = await self._run_control("reload")
 
+            self._assume_state(previous, previous.state if rc == 0 else None)
             return ServiceControlResult(
                 action="reload",
                 success=rc == 0,
@@ -205,6 +531,7 @@ class UnboundClient(BaseResolverClient):
                 current_state=previous.state,
             )
         except Exception as e:
+            self._assume_state(previous, None)
             return ServiceControlResult(
                 action="reload",
                 success=False,
@@ -212,17 +539,84 @@ class UnboundClient(BaseResolverClient):
                 previous_state=previous.state,
                 current_state=previous.state,
             )
+        finally:
+            # Answers cached before the change may no longer hold
+            self.clear_query_cache()
 
     # ========================================================================
     # Query Operations
     # ========================================================================
 
+    def _cache_key(self, query: DNSQuery) -> tuple:
+        """Build the response cache key for a query."""
+        return (
+            query.name.lower(),
+            query.record_type,
+            query.server or self.host,
+            query.port or self.port,
+            query.dnssec,
+            query.use_tcp,
+        )
+
+    def _cache_get(self, key: tuple, now: float) -> tuple[float, DNSResponse] | None:
+        """Return (stored at, response) if cached and not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        expiry, stored_at, response = entry
+        if expiry <= now:
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return stored_at, response
+
+    def _cache_put(self, key: tuple, response: DNSResponse, now: float) -> None:
+        """Cache a response for the minimum TTL of its answer records."""
+        ttl = min((r.ttl for r in response.records), default=0)
+        if ttl <= 0 or self._cache_max <= 0:
+            return
+
+        self._cache[key] = (now + ttl, now, response)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+
+    def clear_query_cache(self) -> None:
+        """Drop all locally cached query responses."""
+        self._cache.clear()
+
     async def query(self, query: DNSQuery) -> DNSResponse:
-        """Execute a DNS query against Unbound."""
-        start_time = asyncio.get_event_loop().time()
+        """
+        Execute a DNS query against Unbound.
+
+        Successful answers are cached locally until their lowest record TTL
+        expires, so repeated lookups skip the network round-trip. Cached
+        answers report their TTLs counted down since they were stored. Set
+        ``use_cache`` to False to always ask the server.
+        """
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
+
+        cache_key = self._cache_key(query)
+        cached = self._cache_get(cache_key, start_time) if self.use_cache else None
+        if cached is not None:
+            stored_at, response = cached
+            elapsed = int(start_time - stored_at)
+            records = response.records
+            if elapsed:
+                records = [r.model_copy(update={"ttl": r.ttl - elapsed}) for r in records]
+            return response.model_copy(
+                update={
+                    "query": query,
+                    "records": records,
+                    "query_time_ms": (loop.time() - start_time) * 1000,
+                }
+            )
 
         try:
-            rdtype = dns.rdatatype.from_text(query.record_type.value)
+            rdtype = _rdtype_from_record_type(query.record_type)
             msg = dns.message.make_query(query.name, rdtype)
 
             if query.dnssec:
@@ -232,44 +626,53 @@ class UnboundClient(BaseResolverClient):
             server = query.server or self.host
             port = query.port or self.port
 
-            if query.use_tcp:
-                response = await asyncio.to_thread(
-                    dns.query.tcp, msg, server, port=port, timeout=query.timeout
-                )
-            else:
-                response = await asyncio.to_thread(
-                    dns.query.udp, msg, server, port=port, timeout=query.timeout
-                )
+            send = dns.query.tcp if query.use_tcp else dns.query.udp
+            response = await loop.run_in_executor(
+                self._dns_executor(),
+                partial(send, msg, server, port=port, timeout=query.timeout),
+            )
 
-            end_time = asyncio.get_event_loop().time()
+            end_time = loop.time()
             query_time_ms = (end_time - start_time) * 1000
 
+            # Fields are already typed here, so skip per-record validation
+            # and hoist the per-rrset conversions out of the rdata loop.
+            construct = DNSRecord.model_construct
             records: list[DNSRecord] = []
             for rrset in response.answer:
-                for rdata in rrset:
-                    records.append(
-                        DNSRecord(
-                            name=str(rrset.name),
-                            record_type=RecordType(dns.rdatatype.to_text(rrset.rdtype)),
-                            ttl=rrset.ttl,
-                            value=str(rdata),
-                        )
+                name = str(rrset.name)
+                record_type = _record_type_from_rdtype(rrset.rdtype)
+                ttl = rrset.ttl
+                records.extend(
+                    construct(
+                        name=name,
+                        record_type=record_type,
+                        ttl=ttl,
+                        value=str(rdata),
                     )
+                    for rdata in rrset
+                )
 
             dnssec_valid = None
             if query.dnssec:
                 dnssec_valid = bool(response.flags & dns.flags.AD)
 
-            return DNSResponse(
+            result = DNSResponse.model_construct(
                 query=query,
                 records=records,
-                rcode=dns.rcode.to_text(response.rcode()),
-                flags=[str(f) for f in dns.flags.to_text(response.flags).split()],
+                rcode=_rcode_text(response.rcode()),
+                flags=[name for bit, name in _FLAG_BITS if response.flags & bit],
                 query_time_ms=query_time_ms,
                 server=f"{server}:{port}",
                 dnssec_valid=dnssec_valid,
             )
 
+            # Only cache good answers; SERVFAIL and friends are retried next time
+            if self.use_cache and result.rcode == "NOERROR":
+                self._cache_put(cache_key, result, end_time)
+
+            return result
+
         except Exception as e:
             end_time = asyncio.get_event_loop().time()
             return DNSResponse(
@@ -282,11 +685,40 @@ class UnboundClient(BaseResolverClient):
             )
 
     async def query_bulk(self, queries: list[DNSQuery]) -> BulkQueryResult:
-        """Execute multiple DNS queries concurrently."""
+        """
+        Execute multiple DNS queries concurrently.
+
+        Identical queries are resolved once and fanned out to every duplicate,
+        and at most ``bulk_concurrency`` lookups are in flight at a time so
+        large batches don't starve the thread pool used for blocking I/O.
+        """
         start_time = asyncio.get_event_loop().time()
 
-        tasks = [self.query(q) for q in queries]
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        semaphore = asyncio.Semaphore(max(1, self._bulk_concurrency))
+
+        async def _guarded(q: DNSQuery) -> DNSResponse:
+            async with semaphore:
+                return await self.query(q)
+
+        # Dedupe identical queries, remembering which slot each one maps to
+        unique: dict[tuple, int] = {}
+        slots: list[int] = []
+        tasks = []
+        for q in queries:
+            key = self._cache_key(q)
+            if key not in unique:
+                unique[key] = len(tasks)
+                tasks.append(_guarded(q))
+            slots.append(unique[key])
+
+        unique_responses = await asyncio.gather(*tasks, return_exceptions=True)
+
+        responses: list[DNSResponse | BaseException] = []
+        for q, slot in zip(queries, slots, strict=True):
+            resp = unique_responses[slot]
+            if isinstance(resp, DNSResponse) and resp.query is not q:
+                resp = resp.model_copy(update={"query": q})
+            responses.append(resp)
 
         successful_responses: list[DNSResponse] = []
         errors: list[dict] = []
@@ -323,45 +755,51 @@ class UnboundClient(BaseResolverClient):
 
     async def get_cache_stats(self) -> CacheStats:
         """Get cache statistics via unbound-control stats."""
-        stats = CacheStats(
-            resolver=ResolverType.UNBOUND,
-            size=0,
-            hits=0,
-            misses=0,
-            hit_ratio=0.0,
-        )
+        counts = {"size": 0, "hits": 0, "misses": 0}
 
         try:
-            stdout, stderr, rc = await self._run_control("stats_noreset")
+            values = await self._get_stats()
 
-            if rc == 0:
-                for line in stdout.split("\n"):
-                    if "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    if key == "total.num.cachehits":
-                        stats.hits = int(value)
-                    elif key == "total.num.cachemiss":
-                        stats.misses = int(value)
-                    elif key == "msg.cache.count":
-                        stats.size = int(value)
-                    elif key == "rrset.cache.count":
-                        stats.size += int(value)
-
-                total = stats.hits + stats.misses
-                if total > 0:
-                    stats.hit_ratio = stats.hits / total
+            for key, field in _CACHE_STAT_FIELDS.items():
+                value = values.get(key)
+                if value is not None:
+                    counts[field] += int(value)
 
         except Exception:
-            pass
+            counts = {"size": 0, "hits": 0, "misses": 0}
+
+        total = counts["hits"] + counts["misses"]
+        return CacheStats(
+            resolver=ResolverType.UNBOUND,
+            hit_ratio=counts["hits"] / total if total > 0 else 0.0,
+            **counts,
+        )
+
+    async def _get_stats(self) -> dict[str, str]:
+        """
+        Fetch and parse ``stats_noreset`` output.
+
+        The command output is memoized briefly and parsed once, so cache
+        stats, metrics and health checks issued together share a single
+        unbound-control invocation.
+        """
+        stdout, stderr, rc = await self._run_control("stats_noreset", ttl=1.0)
+        if rc != 0:
+            return {}
+
+        if self._stats_parsed is not None and self._stats_parsed[0] is stdout:
+            return self._stats_parsed[1]
 
-        return stats
+        # Single regex scan over the buffer - no intermediate list of lines
+        values = dict(m.groups() for m in _STAT_LINE_RE.finditer(stdout))
+
+        self._stats_parsed = (stdout, values)
+        return values
 
     async def flush_cache(self) -> CachePurgeResult:
         """Flush entire Unbound cache."""
+        self.clear_query_cache()
+
         try:
             stdout, stderr, rc = await self._run_control("flush_zone", ".")
 
@@ -385,6 +823,8 @@ class UnboundClient(BaseResolverClient):
         if not domain:
             return await self.flush_cache()
 
+        self.clear_query_cache()
+
         try:
             if record_type:
                 stdout, stderr, rc = await self._run_control(
@@ -407,44 +847,46 @@ class UnboundClient(BaseResolverClient):
         domain: str | None = None,
         limit: int = 100,
     ) -> list[CacheEntry]:
-        """Inspect cache entries via unbound-control dump_cache."""
-        entries: list[CacheEntry] = []
+        """
+        Inspect cache entries via unbound-control dump_cache.
 
-        try:
-            stdout, stderr, rc = await self._run_control("dump_cache")
+        The dump is parsed as it streams in and reading stops once ``limit``
+        entries have been collected, so memory stays bounded on large caches.
+        """
+        entries: list[CacheEntry] = []
+        if limit <= 0:
+            return entries
 
-            if rc == 0:
-                count = 0
-                for line in stdout.split("\n"):
-                    if count >= limit:
-                        break
+        domain_lower = domain.lower() if domain else None
 
+        try:
+            async with contextlib.aclosing(self._stream_control("dump_cache")) as lines:
+                async for raw in lines:
                     # Parse cache dump format
                     # Format: name TTL CLASS TYPE rdata
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        name = parts[0]
+                    parts = raw.split(None, 4)
+                    if len(parts) < 5:
+                        continue
 
-                        if domain and domain.lower() not in name.lower():
-                            continue
+                    name = parts[0].decode()
+                    if domain_lower and domain_lower not in name.lower():
+                        continue
 
-                        try:
-                            ttl = int(parts[1])
-                            rtype = parts[3]
-                            value = " ".join(parts[4:])
-
-                            entries.append(CacheEntry(
-                                name=name,
-                                record_type=RecordType(rtype),
-                                ttl_remaining=ttl,
-                                original_ttl=ttl,
-                                value=value,
-                                cached_at=datetime.utcnow(),
-                            ))
-                            count += 1
-                        except (ValueError, KeyError):
-                            continue
+                    try:
+                        ttl = int(parts[1])
+                        entries.append(CacheEntry.model_construct(
+                            name=name,
+                            record_type=_record_type_from_text(parts[3].decode()),
+                            ttl_remaining=ttl,
+                            original_ttl=ttl,
+                            value=parts[4].decode().strip(),
+                            cached_at=datetime.utcnow(),
+                        ))
+                    except (ValueError, KeyError):
+                        continue
 
+                    if len(entries) >= limit:
+                        break
         except Exception:
             pass
 
@@ -462,55 +904,58 @@ class UnboundClient(BaseResolverClient):
             return await f.read()
 
     async def validate_config(self, config: str) -> ConfigValidationResult:
-        """Validate unbound.conf syntax using unbound-checkconf."""
-        import tempfile
-        import os
+        """
+        Validate unbound.conf syntax using unbound-checkconf.
+
+        The config is piped through /dev/stdin so validation never touches
+        the disk. Where that isn't available, a temp file is used instead
+        (on /dev/shm when present).
+        """
+        if self._checkconf_stdin:
+            proc = await _exec(
+                _executable("unbound-checkconf"), "/dev/stdin",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await proc.communicate(config.encode())
+            return self._checkconf_result(proc.returncode, stderr, None)
 
         # Write config to temp file for validation
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".conf", delete=False) as f:
+        temp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".conf", dir=temp_dir, delete=False
+        ) as f:
             f.write(config)
             temp_path = f.name
 
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "unbound-checkconf", temp_path,
+            proc = await _exec(
+                _executable("unbound-checkconf"), temp_path,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
             stdout, stderr = await proc.communicate()
-
-            if proc.returncode == 0:
-                return ConfigValidationResult(valid=True, config_path=temp_path)
-            else:
-                from dnsscience.core.models import ConfigValidationError
-                return ConfigValidationResult(
-                    valid=False,
-                    errors=[ConfigValidationError(message=stderr.decode())],
-                    config_path=temp_path,
-                )
+            return self._checkconf_result(proc.returncode, stderr, temp_path)
         finally:
             os.unlink(temp_path)
 
-    async def diff_config(self, new_config: str) -> ConfigDiff:
-        """Diff new config against current running config."""
-        current = await self.get_config()
-
-        current_lines = set(current.strip().split("\n"))
-        new_lines = set(new_config.strip().split("\n"))
-
-        return ConfigDiff(
-            source_path=self.config_path,
-            target_path="<new>",
-            additions=list(new_lines - current_lines),
-            deletions=list(current_lines - new_lines),
-            is_different=current_lines != new_lines,
+    def _checkconf_result(
+        self, returncode: int | None, stderr: bytes, config_path: str | None
+    ) -> ConfigValidationResult:
+        """Build a validation result from an unbound-checkconf run."""
+        if returncode == 0:
+            return ConfigValidationResult(valid=True, config_path=config_path)
+
+        return ConfigValidationResult(
+            valid=False,
+            errors=[ConfigValidationError(message=stderr.decode())],
+            config_path=config_path,
         )
 
     async def apply_config(self, config: str, reload: bool = True) -> ServiceControlResult:
         """Write new config and optionally reload."""
-        import aiofiles
-
-        previous = await self.get_status()
+        previous = await self._known_status()
 
         # Validate first
         validation = await self.validate_config(config)
@@ -523,9 +968,9 @@ class UnboundClient(BaseResolverClient):
                 current_state=previous.state,
             )
 
-        # Write config
-        async with aiofiles.open(self.config_path, "w") as f:
-            await f.write(config)
+        # Write config atomically; fsync can block, so keep it off the loop
+        await asyncio.to_thread(self._write_config_atomic, config)
+        self.clear_query_cache()
 
         if reload:
             return await self.reload()
@@ -538,6 +983,38 @@ class UnboundClient(BaseResolverClient):
             current_state=previous.state,
         )
 
+    def _write_config_atomic(self, config: str) -> None:
+        """
+        Replace the config file without ever exposing a partial write.
+
+        The new content goes to a temp file next to the config (same
+        filesystem) which is then renamed over it, keeping the original
+        file's mode and ownership so Unbound can still read it.
+        """
+        directory = os.path.dirname(os.path.abspath(self.config_path))
+        fd, temp_path = tempfile.mkstemp(prefix=".unbound.conf.", dir=directory)
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(config)
+                f.flush()
+                os.fsync(f.fileno())
+
+            try:
+                st = os.stat(self.config_path)
+                os.chmod(temp_path, stat.S_IMODE(st.st_mode))
+                os.chown(temp_path, st.st_uid, st.st_gid)
+            except FileNotFoundError:
+                os.chmod(temp_path, 0o644)
+            except PermissionError:
+                pass
+
+            os.replace(temp_path, self.config_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            raise
+
     # ========================================================================
     # Health & Metrics
     # ========================================================================
@@ -571,20 +1048,15 @@ class UnboundClient(BaseResolverClient):
         metrics: list[MetricValue] = []
 
         try:
-            stdout, stderr, rc = await self._run_control("stats_noreset")
-
-            if rc == 0:
-                for line in stdout.split("\n"):
-                    if "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    try:
-                        metrics.append(MetricValue(
-                            name=f"unbound_{key.strip().replace('.', '_')}",
-                            value=float(value.strip()),
-                        ))
-                    except ValueError:
-                        pass
+            values = await self._get_stats()
+
+            construct = MetricValue.model_construct
+            for key, value in values.items():
+                try:
+                    number = float(value)
+                except ValueError:
+                    continue
+                metrics.append(construct(name=_metric_name(key), value=number))
 
         except Exception:
             pass
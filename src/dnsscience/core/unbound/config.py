@@ -1,76 +1,69 @@
 """Unbound configuration generator."""
 
+from collections.abc import Callable
+from io import StringIO
+from typing import Any
+
 from dnsscience.core.base import BaseConfigGenerator
 from dnsscience.core.models import ResolverType
 
+# Rendering helpers shared by every unbound.conf section
+_BOOL = {True: "yes", False: "no"}
+
+# Sections that may appear multiple times, in output order
+_ZONE_SECTIONS = ("forward-zone", "stub-zone", "auth-zone")
+
+
+def _write_kv(
+    write: Callable[[str], Any], key: str, value: Any, quote_name: bool = False
+) -> None:
+    """Write one option as config lines (lists repeat the key)."""
+    if isinstance(value, list):
+        for v in value:
+            write(f"    {key}: {v}\n")
+    elif isinstance(value, bool):
+        write(f"    {key}: {_BOOL[value]}\n")
+    elif quote_name and key == "name":
+        write(f'    {key}: "{value}"\n')
+    else:
+        write(f"    {key}: {value}\n")
+
+
+def _write_section(
+    write: Callable[[str], Any], section: str, options: dict, quote_name: bool = False
+) -> None:
+    """Write a section header, its options and a trailing blank line."""
+    write(f"{section}:\n")
+    for key, value in options.items():
+        _write_kv(write, key, value, quote_name)
+    write("\n")
+
 
 class UnboundConfigGenerator(BaseConfigGenerator):
     """Generator for Unbound configuration files."""
 
     def generate(self, config_dict: dict) -> str:
         """Generate unbound.conf from structured configuration."""
-        lines: list[str] = []
+        buf = StringIO()
+        write = buf.write
 
         # Server section
         if "server" in config_dict:
-            lines.append("server:")
-            server = config_dict["server"]
-
-            for key, value in server.items():
-                if isinstance(value, list):
-                    for v in value:
-                        lines.append(f"    {key}: {v}")
-                elif isinstance(value, bool):
-                    lines.append(f"    {key}: {'yes' if value else 'no'}")
-                else:
-                    lines.append(f"    {key}: {value}")
-            lines.append("")
-
-        # Forward zones
-        for fz in config_dict.get("forward-zone", []):
-            lines.append("forward-zone:")
-            for key, value in fz.items():
-                if isinstance(value, list):
-                    for v in value:
-                        lines.append(f"    {key}: {v}")
-                else:
-                    lines.append(f'    {key}: "{value}"' if key == "name" else f"    {key}: {value}")
-            lines.append("")
-
-        # Stub zones
-        for sz in config_dict.get("stub-zone", []):
-            lines.append("stub-zone:")
-            for key, value in sz.items():
-                if isinstance(value, list):
-                    for v in value:
-                        lines.append(f"    {key}: {v}")
-                else:
-                    lines.append(f'    {key}: "{value}"' if key == "name" else f"    {key}: {value}")
-            lines.append("")
-
-        # Auth zones
-        for az in config_dict.get("auth-zone", []):
-            lines.append("auth-zone:")
-            for key, value in az.items():
-                if isinstance(value, list):
-                    for v in value:
-                        lines.append(f"    {key}: {v}")
-                else:
-                    lines.append(f'    {key}: "{value}"' if key == "name" else f"    {key}: {value}")
-            lines.append("")
+            _write_section(write, "server", config_dict["server"])
+
+        # Forward, stub and auth zones
+        for section in _ZONE_SECTIONS:
+            for zone in config_dict.get(section, []):
+                _write_section(write, section, zone, quote_name=True)
 
         # Remote control
         if "remote-control" in config_dict:
-            lines.append("remote-control:")
-            rc = config_dict["remote-control"]
-            for key, value in rc.items():
-                if isinstance(value, bool):
-                    lines.append(f"    {key}: {'yes' if value else 'no'}")
-                else:
-                    lines.append(f"    {key}: {value}")
-            lines.append("")
-
-        return "\n".join(lines)
+            _write_section(write, "remote-control", config_dict["remote-control"])
+
+        # Every line is newline-terminated; the file itself ends without one
+        if buf.tell():
+            buf.truncate(buf.tell() - 1)
+        return buf.getvalue()
 
     def from_other(self, other_config: dict, source_type: ResolverType) -> str:
         """Generate unbound.conf from another resolver's configuration."""
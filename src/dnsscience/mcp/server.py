@@ -1,356 +1,483 @@
 """MCP Server implementation for DNS Science Toolkit."""
 
 import asyncio
+import functools
 import json
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date
 from typing import Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+from dnsscience.core.compare.engine import CompareEngine
 from dnsscience.core.coredns.client import CoreDNSClient
+from dnsscience.core.coredns.config import CorefileParser
+from dnsscience.core.migrate.coredns_to_unbound import CoreDNSToUnboundMigrator
+from dnsscience.core.migrate.engine import Migrator
+from dnsscience.core.migrate.parsers.unbound_conf import UnboundConfigParser
+from dnsscience.core.migrate.unbound_to_coredns import UnboundToCoreDNSMigrator
 from dnsscience.core.models import DNSQuery, RecordType, ResolverType
 
 # Create the MCP server
 server = Server("dnsscience-toolkit")
 
+# Record type mnemonic -> enum member, for argument parsing
+_RTYPE = {rt.value: rt for rt in RecordType}
+
+# Tool handlers take the call arguments and return a JSON-ready dict
+Handler = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+def _json_default(obj: Any) -> str:
+    """Encode values json can't handle, with datetimes in ISO 8601 like msgspec."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return str(obj)
+
+
+# Compact output keeps responses on the C encoder (indent forces the Python one)
+_ENCODER = json.JSONEncoder(
+    default=_json_default, separators=(",", ":"), ensure_ascii=False
+)
+
+if msgspec is not None:
+    # msgspec's encoder is several times faster on large model_dump() trees
+    _MSGSPEC_ENCODER = msgspec.json.Encoder(enc_hook=str)
+
+    def _encode(obj: Any) -> str:
+        return _MSGSPEC_ENCODER.encode(obj).decode()
+
+else:
+    _encode = _ENCODER.encode
+
 # Global clients (initialized on first use)
 _coredns_client: CoreDNSClient | None = None
+_target_coredns: CoreDNSClient | None = None
+_client_lock = asyncio.Lock()
+_target_lock = asyncio.Lock()
 
 
 async def get_coredns_client() -> CoreDNSClient:
     """Get or create CoreDNS client."""
     global _coredns_client
-    if _coredns_client is None:
-        _coredns_client = CoreDNSClient()
-        await _coredns_client.connect()
+    if _coredns_client is not None:
+        return _coredns_client
+
+    # Concurrent first calls must not each create (and leak) a client
+    async with _client_lock:
+        if _coredns_client is None:
+            client = CoreDNSClient()
+            await client.connect()
+            _coredns_client = client
     return _coredns_client
 
 
+async def get_target_coredns() -> CoreDNSClient:
+    """Get or create the CoreDNS client used as the compare/migration target."""
+    global _target_coredns
+    if _target_coredns is not None:
+        return _target_coredns
+
+    async with _target_lock:
+        if _target_coredns is None:
+            client = CoreDNSClient(port=5353)  # Different port for demo
+            await client.connect()
+            _target_coredns = client
+    return _target_coredns
+
+
+async def close_clients() -> None:
+    """Disconnect any clients created by the tool handlers."""
+    global _coredns_client, _target_coredns
+    async with _client_lock, _target_lock:
+        for client in (_coredns_client, _target_coredns):
+            if client is not None:
+                await client.disconnect()
+        _coredns_client = _target_coredns = None
+
+
+async def get_compare_clients() -> tuple[CoreDNSClient, CoreDNSClient]:
+    """Get the source and target clients, connecting both concurrently."""
+    source, target = await asyncio.gather(get_coredns_client(), get_target_coredns())
+    return source, target
+
+
 # ============================================================================
 # Tool Definitions
 # ============================================================================
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available MCP tools."""
-    return [
-        # Service Management
-        Tool(
-            name="dns_service_status",
-            description="Get the status of the DNS resolver service (CoreDNS or Unbound)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resolver": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "description": "Target resolver",
-                        "default": "coredns",
-                    }
-                },
+# Tool schemas are fixed, so the list is built once at import
+_TOOLS_LIST: list[Tool] = [
+    # Service Management
+    Tool(
+        name="dns_service_status",
+        description="Get the status of the DNS resolver service (CoreDNS or Unbound)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolver": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "description": "Target resolver",
+                    "default": "coredns",
+                }
             },
-        ),
-        Tool(
-            name="dns_service_control",
-            description="Control the DNS resolver service (start, stop, restart)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resolver": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "coredns",
-                    },
-                    "action": {
-                        "type": "string",
-                        "enum": ["start", "stop", "restart"],
-                        "description": "Action to perform",
-                    },
+        },
+    ),
+    Tool(
+        name="dns_service_control",
+        description="Control the DNS resolver service (start, stop, restart)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolver": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "coredns",
                 },
-                "required": ["action"],
-            },
-        ),
-        Tool(
-            name="dns_service_reload",
-            description="Reload DNS resolver configuration without restart",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resolver": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "coredns",
-                    }
+                "action": {
+                    "type": "string",
+                    "enum": ["start", "stop", "restart"],
+                    "description": "Action to perform",
                 },
             },
-        ),
-        # Cache Operations
-        Tool(
-            name="dns_cache_flush",
-            description="Flush the DNS cache (all entries)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resolver": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "coredns",
-                    }
-                },
+            "required": ["action"],
+        },
+    ),
+    Tool(
+        name="dns_service_reload",
+        description="Reload DNS resolver configuration without restart",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolver": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "coredns",
+                }
             },
-        ),
-        Tool(
-            name="dns_cache_stats",
-            description="Get DNS cache statistics (hits, misses, size)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resolver": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "coredns",
-                    }
-                },
+        },
+    ),
+    # Cache Operations
+    Tool(
+        name="dns_cache_flush",
+        description="Flush the DNS cache (all entries)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolver": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "coredns",
+                }
             },
-        ),
-        Tool(
-            name="dns_cache_purge",
-            description="Purge a specific domain from the DNS cache",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resolver": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "coredns",
-                    },
-                    "domain": {
-                        "type": "string",
-                        "description": "Domain to purge from cache",
-                    },
-                },
-                "required": ["domain"],
+        },
+    ),
+    Tool(
+        name="dns_cache_stats",
+        description="Get DNS cache statistics (hits, misses, size)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolver": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "coredns",
+                }
             },
-        ),
-        # Query Operations
-        Tool(
-            name="dns_query",
-            description="Perform a DNS query (lookup a domain)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "domain": {
-                        "type": "string",
-                        "description": "Domain name to query",
-                    },
-                    "record_type": {
-                        "type": "string",
-                        "enum": ["A", "AAAA", "CNAME", "MX", "NS", "TXT", "SOA", "PTR", "SRV"],
-                        "default": "A",
-                        "description": "DNS record type",
-                    },
-                    "server": {
-                        "type": "string",
-                        "description": "DNS server to query (optional)",
-                    },
-                    "dnssec": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "Request DNSSEC validation",
-                    },
+        },
+    ),
+    Tool(
+        name="dns_cache_purge",
+        description="Purge a specific domain from the DNS cache",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolver": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "coredns",
                 },
-                "required": ["domain"],
-            },
-        ),
-        Tool(
-            name="dns_query_trace",
-            description="Trace DNS resolution path for a domain",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "domain": {
-                        "type": "string",
-                        "description": "Domain name to trace",
-                    },
-                    "record_type": {
-                        "type": "string",
-                        "enum": ["A", "AAAA", "CNAME", "MX", "NS"],
-                        "default": "A",
-                    },
+                "domain": {
+                    "type": "string",
+                    "description": "Domain to purge from cache",
                 },
-                "required": ["domain"],
             },
-        ),
-        Tool(
-            name="dns_query_compare",
-            description="Compare DNS responses between two resolvers",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "domain": {
-                        "type": "string",
-                        "description": "Domain to query on both resolvers",
-                    },
-                    "source": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "coredns",
-                    },
-                    "target": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "unbound",
-                    },
+            "required": ["domain"],
+        },
+    ),
+    # Query Operations
+    Tool(
+        name="dns_query",
+        description="Perform a DNS query (lookup a domain)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "Domain name to query",
                 },
-                "required": ["domain"],
-            },
-        ),
-        # Configuration
-        Tool(
-            name="dns_config_validate",
-            description="Validate DNS resolver configuration syntax",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resolver": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "coredns",
-                    },
-                    "config": {
-                        "type": "string",
-                        "description": "Configuration content to validate",
-                    },
+                "record_type": {
+                    "type": "string",
+                    "enum": ["A", "AAAA", "CNAME", "MX", "NS", "TXT", "SOA", "PTR", "SRV"],
+                    "default": "A",
+                    "description": "DNS record type",
+                },
+                "server": {
+                    "type": "string",
+                    "description": "DNS server to query (optional)",
+                },
+                "dnssec": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Request DNSSEC validation",
                 },
-                "required": ["config"],
             },
-        ),
-        Tool(
-            name="dns_config_get",
-            description="Get current DNS resolver configuration",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resolver": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "coredns",
-                    }
+            "required": ["domain"],
+        },
+    ),
+    Tool(
+        name="dns_query_trace",
+        description="Trace DNS resolution path for a domain",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "Domain name to trace",
+                },
+                "record_type": {
+                    "type": "string",
+                    "enum": ["A", "AAAA", "CNAME", "MX", "NS"],
+                    "default": "A",
                 },
             },
-        ),
-        Tool(
-            name="dns_config_diff",
-            description="Show differences between current and new configuration",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resolver": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "coredns",
-                    },
-                    "new_config": {
-                        "type": "string",
-                        "description": "New configuration to compare against current",
-                    },
+            "required": ["domain"],
+        },
+    ),
+    Tool(
+        name="dns_query_compare",
+        description="Compare DNS responses between two resolvers",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "Domain to query on both resolvers",
+                },
+                "source": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "coredns",
+                },
+                "target": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "unbound",
                 },
-                "required": ["new_config"],
             },
-        ),
-        # Migration
-        Tool(
-            name="dns_migrate_plan",
-            description="Generate a migration plan between DNS resolvers",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "description": "Source resolver type",
-                    },
-                    "target": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "description": "Target resolver type",
-                    },
-                    "config": {
-                        "type": "string",
-                        "description": "Source configuration to migrate",
-                    },
+            "required": ["domain"],
+        },
+    ),
+    # Configuration
+    Tool(
+        name="dns_config_validate",
+        description="Validate DNS resolver configuration syntax",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolver": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "coredns",
+                },
+                "config": {
+                    "type": "string",
+                    "description": "Configuration content to validate",
                 },
-                "required": ["source", "target", "config"],
             },
-        ),
-        Tool(
-            name="dns_migrate_convert",
-            description="Convert configuration from one resolver format to another",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                    },
-                    "target": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                    },
-                    "config": {
-                        "type": "string",
-                        "description": "Configuration to convert",
-                    },
+            "required": ["config"],
+        },
+    ),
+    Tool(
+        name="dns_config_get",
+        description="Get current DNS resolver configuration",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolver": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "coredns",
+                }
+            },
+        },
+    ),
+    Tool(
+        name="dns_config_diff",
+        description="Show differences between current and new configuration",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolver": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "coredns",
+                },
+                "new_config": {
+                    "type": "string",
+                    "description": "New configuration to compare against current",
                 },
-                "required": ["source", "target", "config"],
             },
-        ),
-        Tool(
-            name="dns_migrate_validate",
-            description="Validate migration by comparing resolver responses",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "domains": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of domains to test",
-                    }
+            "required": ["new_config"],
+        },
+    ),
+    # Migration
+    Tool(
+        name="dns_migrate_plan",
+        description="Generate a migration plan between DNS resolvers",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "description": "Source resolver type",
+                },
+                "target": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "description": "Target resolver type",
+                },
+                "config": {
+                    "type": "string",
+                    "description": "Source configuration to migrate",
                 },
             },
-        ),
-        # Health
-        Tool(
-            name="dns_health_check",
-            description="Perform comprehensive health check on DNS resolver",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resolver": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "coredns",
-                    }
+            "required": ["source", "target", "config"],
+        },
+    ),
+    Tool(
+        name="dns_migrate_convert",
+        description="Convert configuration from one resolver format to another",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                },
+                "target": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
                 },
+                "config": {
+                    "type": "string",
+                    "description": "Configuration to convert",
+                },
+            },
+            "required": ["source", "target", "config"],
+        },
+    ),
+    Tool(
+        name="dns_migrate_validate",
+        description="Validate migration by comparing resolver responses",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domains": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of domains to test",
+                }
             },
-        ),
-        Tool(
-            name="dns_health_metrics",
-            description="Get Prometheus metrics from DNS resolver",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resolver": {
-                        "type": "string",
-                        "enum": ["coredns", "unbound"],
-                        "default": "coredns",
-                    }
+        },
+    ),
+    # Health
+    Tool(
+        name="dns_health_check",
+        description="Perform comprehensive health check on DNS resolver",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolver": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "coredns",
+                }
+            },
+        },
+    ),
+    Tool(
+        name="dns_health_metrics",
+        description="Get Prometheus metrics from DNS resolver",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolver": {
+                    "type": "string",
+                    "enum": ["coredns", "unbound"],
+                    "default": "coredns",
+                }
+            },
+        },
+    ),
+    # Batching
+    Tool(
+        name="batch_execute",
+        description="Run several DNS tool calls in one request, concurrently",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool": {
+                                "type": "string",
+                                "description": "Name of the tool to call",
+                            },
+                            "args": {
+                                "type": "object",
+                                "description": "Arguments for the tool",
+                            },
+                        },
+                        "required": ["tool"],
+                    },
+                    "description": "Tool calls to execute",
+                },
+                "max_concurrent": {
+                    "type": "integer",
+                    "default": 8,
+                    "minimum": 1,
+                    "description": "Maximum operations running at once",
+                },
+                "stop_on_error": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Skip operations not yet started once one fails",
                 },
             },
-        ),
-    ]
+            "required": ["operations"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available MCP tools."""
+    return _TOOLS_LIST
 
 
 # ============================================================================
@@ -363,62 +490,95 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
     try:
         result = await _handle_tool(name, arguments)
-        return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+        return [TextContent(type="text", text=_encode(result))]
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [_error_content(str(e))]
+
+
+def _error_content(message: str) -> TextContent:
+    """Wrap an error message as ``{"error": ...}`` without encoding a dict."""
+    return TextContent(type="text", text='{"error":' + _encode(message) + "}")
 
 
 async def _handle_tool(name: str, args: dict[str, Any]) -> dict[str, Any]:
     """Route tool calls to appropriate handlers."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return await handler(args)
 
-    # Service Management
-    if name == "dns_service_status":
-        return await _dns_service_status(args)
-    elif name == "dns_service_control":
-        return await _dns_service_control(args)
-    elif name == "dns_service_reload":
-        return await _dns_service_reload(args)
 
-    # Cache Operations
-    elif name == "dns_cache_flush":
-        return await _dns_cache_flush(args)
-    elif name == "dns_cache_stats":
-        return await _dns_cache_stats(args)
-    elif name == "dns_cache_purge":
-        return await _dns_cache_purge(args)
+# ============================================================================
+# Response Cache
+# ============================================================================
 
-    # Query Operations
-    elif name == "dns_query":
-        return await _dns_query(args)
-    elif name == "dns_query_trace":
-        return await _dns_query_trace(args)
-    elif name == "dns_query_compare":
-        return await _dns_query_compare(args)
+# Tool function and its frozen arguments
+_CacheKey = tuple[Handler, frozenset[tuple[str, Any]]]
 
-    # Configuration
-    elif name == "dns_config_validate":
-        return await _dns_config_validate(args)
-    elif name == "dns_config_get":
-        return await _dns_config_get(args)
-    elif name == "dns_config_diff":
-        return await _dns_config_diff(args)
+# Cache key -> (expiry, dumped response)
+_RESPONSE_CACHE: dict[_CacheKey, tuple[float, dict[str, Any]]] = {}
+_RESPONSE_CACHE_MAX = 256
 
-    # Migration
-    elif name == "dns_migrate_plan":
-        return await _dns_migrate_plan(args)
-    elif name == "dns_migrate_convert":
-        return await _dns_migrate_convert(args)
-    elif name == "dns_migrate_validate":
-        return await _dns_migrate_validate(args)
+# Same key -> the call currently fetching it, shared by concurrent callers
+_INFLIGHT: dict[_CacheKey, asyncio.Task[dict[str, Any]]] = {}
 
-    # Health
-    elif name == "dns_health_check":
-        return await _dns_health_check(args)
-    elif name == "dns_health_metrics":
-        return await _dns_health_metrics(args)
+# Bumped by _invalidate_responses so in-flight reads don't repopulate the cache
+_invalidations = 0
 
-    else:
-        raise ValueError(f"Unknown tool: {name}")
+
+def _ttl_cached(ttl: float = 0.2) -> Callable[[Handler], Handler]:
+    """
+    Reuse a read-only handler's dumped response for ``ttl`` seconds.
+
+    Dashboards polling status or metrics every tick then share one resolver
+    round trip and one model_dump(). Concurrent misses for the same key
+    await a single call. Arguments that can't be hashed bypass the cache.
+    Callers each get their own shallow copy of the shared response.
+    """
+
+    def decorator(func: Handler) -> Handler:
+        async def fetch(key: _CacheKey, args: dict[str, Any]) -> dict[str, Any]:
+            generation = _invalidations
+            result = await func(args)
+            # Don't store a reading taken before a state change
+            if generation == _invalidations:
+                if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+                    _RESPONSE_CACHE.clear()
+                _RESPONSE_CACHE[key] = (time.monotonic() + ttl, result)
+            return result
+
+        @functools.wraps(func)
+        async def wrapper(args: dict[str, Any]) -> dict[str, Any]:
+            try:
+                key: _CacheKey = (func, frozenset(args.items()))
+                hash(key)
+            except TypeError:
+                return await func(args)
+
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return dict(cached[1])
+
+            task = _INFLIGHT.get(key)
+            if task is None:
+                task = asyncio.create_task(fetch(key, args))
+                _INFLIGHT[key] = task
+                task.add_done_callback(
+                    lambda t: _INFLIGHT.get(key) is t and _INFLIGHT.pop(key)
+                )
+            return dict(await asyncio.shield(task))
+
+        return wrapper
+
+    return decorator
+
+
+def _invalidate_responses() -> None:
+    """Drop cached responses after an operation that changes resolver state."""
+    global _invalidations
+    _invalidations += 1
+    _RESPONSE_CACHE.clear()
+    _INFLIGHT.clear()
 
 
 # ============================================================================
@@ -426,6 +586,7 @@ async def _handle_tool(name: str, args: dict[str, Any]) -> dict[str, Any]:
 # ============================================================================
 
 
+@_ttl_cached()
 async def _dns_service_status(args: dict) -> dict:
     """Get service status."""
     client = await get_coredns_client()
@@ -447,6 +608,7 @@ async def _dns_service_control(args: dict) -> dict:
     else:
         raise ValueError(f"Unknown action: {action}")
 
+    _invalidate_responses()
     return result.model_dump()
 
 
@@ -454,6 +616,7 @@ async def _dns_service_reload(args: dict) -> dict:
     """Reload configuration."""
     client = await get_coredns_client()
     result = await client.reload()
+    _invalidate_responses()
     return result.model_dump()
 
 
@@ -461,9 +624,11 @@ async def _dns_cache_flush(args: dict) -> dict:
     """Flush cache."""
     client = await get_coredns_client()
     result = await client.flush_cache()
+    _invalidate_responses()
     return result.model_dump()
 
 
+@_ttl_cached()
 async def _dns_cache_stats(args: dict) -> dict:
     """Get cache stats."""
     client = await get_coredns_client()
@@ -475,18 +640,39 @@ async def _dns_cache_purge(args: dict) -> dict:
     """Purge domain from cache."""
     client = await get_coredns_client()
     result = await client.purge_cache(domain=args["domain"])
+    _invalidate_responses()
     return result.model_dump()
 
 
+def _record_type(args: dict) -> RecordType:
+    """Read the record_type argument (default A)."""
+    value = args.get("record_type", "A")
+    record_type = _RTYPE.get(value)
+    if record_type is None:
+        raise ValueError(f"Unsupported record type: {value}")
+    return record_type
+
+
+@functools.lru_cache(maxsize=512)
+def _make_query(
+    name: str,
+    record_type: RecordType = RecordType.A,
+    server: str | None = None,
+    dnssec: bool = False,
+) -> DNSQuery:
+    """Build a DNSQuery, reusing the validated model for repeated queries."""
+    return DNSQuery(name=name, record_type=record_type, server=server, dnssec=dnssec)
+
+
 async def _dns_query(args: dict) -> dict:
     """Perform DNS query."""
     client = await get_coredns_client()
 
-    query = DNSQuery(
-        name=args["domain"],
-        record_type=RecordType(args.get("record_type", "A")),
-        server=args.get("server"),
-        dnssec=args.get("dnssec", False),
+    query = _make_query(
+        args["domain"],
+        _record_type(args),
+        args.get("server"),
+        args.get("dnssec", False),
     )
 
     response = await client.query(query)
@@ -497,10 +683,7 @@ async def _dns_query_trace(args: dict) -> dict:
     """Trace DNS resolution."""
     client = await get_coredns_client()
 
-    query = DNSQuery(
-        name=args["domain"],
-        record_type=RecordType(args.get("record_type", "A")),
-    )
+    query = _make_query(args["domain"], _record_type(args))
 
     responses = await client.trace(query)
     return {"trace": [r.model_dump() for r in responses]}
@@ -508,20 +691,13 @@ async def _dns_query_trace(args: dict) -> dict:
 
 async def _dns_query_compare(args: dict) -> dict:
     """Compare query between resolvers."""
-    from dnsscience.core.compare.engine import CompareEngine
-
-    source_client = await get_coredns_client()
     # Would need to initialize target client based on args
-    target_client = CoreDNSClient(port=5353)  # Different port for demo
-    await target_client.connect()
+    source_client, target_client = await get_compare_clients()
 
-    try:
-        engine = CompareEngine(source_client, target_client)
-        query = DNSQuery(name=args["domain"], record_type=RecordType.A)
-        diff = await engine.compare_single(query)
-        return diff.model_dump()
-    finally:
-        await target_client.disconnect()
+    engine = CompareEngine(source_client, target_client)
+    query = _make_query(args["domain"])
+    diff = await engine.compare_single(query)
+    return diff.model_dump()
 
 
 async def _dns_config_validate(args: dict) -> dict:
@@ -530,19 +706,16 @@ async def _dns_config_validate(args: dict) -> dict:
     config = args["config"]
 
     if resolver == "coredns":
-        from dnsscience.core.coredns.config import CorefileParser
-
         parser = CorefileParser()
         result = parser.validate(config)
     else:
-        from dnsscience.core.migrate.parsers.unbound_conf import UnboundConfigParser
-
         parser = UnboundConfigParser()
         result = parser.validate(config)
 
     return result.model_dump()
 
 
+@_ttl_cached()
 async def _dns_config_get(args: dict) -> dict:
     """Get current configuration."""
     client = await get_coredns_client()
@@ -557,21 +730,19 @@ async def _dns_config_diff(args: dict) -> dict:
     return diff.model_dump()
 
 
-async def _dns_migrate_plan(args: dict) -> dict:
-    """Generate migration plan."""
-    source = args["source"]
-    target = args["target"]
-    config = args["config"]
+# (source, target) -> migrator; they run synchronously, so one instance each is enough
+_MIGRATORS: dict[tuple[str, str], Migrator] = {
+    ("coredns", "unbound"): CoreDNSToUnboundMigrator(),
+    ("unbound", "coredns"): UnboundToCoreDNSMigrator(),
+}
 
-    if source == "coredns" and target == "unbound":
-        from dnsscience.core.migrate.coredns_to_unbound import CoreDNSToUnboundMigrator
 
-        migrator = CoreDNSToUnboundMigrator()
-    elif source == "unbound" and target == "coredns":
-        from dnsscience.core.migrate.unbound_to_coredns import UnboundToCoreDNSMigrator
+async def _dns_migrate_plan(args: dict) -> dict:
+    """Generate migration plan."""
+    source, target, config = args["source"], args["target"], args["config"]
 
-        migrator = UnboundToCoreDNSMigrator()
-    else:
+    migrator = _MIGRATORS.get((source, target))
+    if migrator is None:
         raise ValueError(f"Unsupported migration: {source} → {target}")
 
     mappings, warnings, unsupported = migrator.analyze_config(config)
@@ -591,19 +762,10 @@ async def _dns_migrate_plan(args: dict) -> dict:
 
 async def _dns_migrate_convert(args: dict) -> dict:
     """Convert configuration."""
-    source = args["source"]
-    target = args["target"]
-    config = args["config"]
-
-    if source == "coredns" and target == "unbound":
-        from dnsscience.core.migrate.coredns_to_unbound import CoreDNSToUnboundMigrator
-
-        migrator = CoreDNSToUnboundMigrator()
-    elif source == "unbound" and target == "coredns":
-        from dnsscience.core.migrate.unbound_to_coredns import UnboundToCoreDNSMigrator
+    source, target, config = args["source"], args["target"], args["config"]
 
-        migrator = UnboundToCoreDNSMigrator()
-    else:
+    migrator = _MIGRATORS.get((source, target))
+    if migrator is None:
         raise ValueError(f"Unsupported conversion: {source} → {target}")
 
     converted = migrator.generate_target_config(config)
@@ -612,23 +774,17 @@ async def _dns_migrate_convert(args: dict) -> dict:
 
 async def _dns_migrate_validate(args: dict) -> dict:
     """Validate migration."""
-    from dnsscience.core.compare.engine import CompareEngine
-
     domains = args.get("domains", ["google.com", "cloudflare.com", "example.com"])
 
-    source_client = await get_coredns_client()
-    target_client = CoreDNSClient(port=5353)
-    await target_client.connect()
+    source_client, target_client = await get_compare_clients()
 
-    try:
-        engine = CompareEngine(source_client, target_client)
-        queries = [DNSQuery(name=d, record_type=RecordType.A) for d in domains]
-        result = await engine.compare_bulk(queries)
-        return result.model_dump()
-    finally:
-        await target_client.disconnect()
+    engine = CompareEngine(source_client, target_client)
+    queries = [_make_query(d) for d in domains]
+    result = await engine.compare_bulk(queries)
+    return result.model_dump()
 
 
+@_ttl_cached()
 async def _dns_health_check(args: dict) -> dict:
     """Health check."""
     client = await get_coredns_client()
@@ -636,6 +792,7 @@ async def _dns_health_check(args: dict) -> dict:
     return health.model_dump()
 
 
+@_ttl_cached()
 async def _dns_health_metrics(args: dict) -> dict:
     """Get metrics."""
     client = await get_coredns_client()
@@ -643,20 +800,96 @@ async def _dns_health_metrics(args: dict) -> dict:
     return metrics.model_dump()
 
 
+async def _batch_execute(args: dict) -> dict:
+    """Run several tool calls concurrently and collect their results in order."""
+    operations = args["operations"]
+    stop_on_error = args.get("stop_on_error", False)
+    semaphore = asyncio.Semaphore(max(1, int(args.get("max_concurrent", 8))))
+    failed = False
+
+    async def run_one(op: Any) -> dict:
+        nonlocal failed
+        # Malformed operations become error entries instead of failing the batch
+        tool = op.get("tool") if isinstance(op, dict) else None
+        async with semaphore:
+            if stop_on_error and failed:
+                return {"tool": tool, "skipped": True}
+            try:
+                if not isinstance(op, dict) or not isinstance(tool, str):
+                    raise ValueError("Each operation needs a 'tool' name")
+                if tool == "batch_execute":
+                    raise ValueError("batch_execute cannot be nested")
+                tool_args = op.get("args") or {}
+                if not isinstance(tool_args, dict):
+                    raise ValueError("Operation 'args' must be an object")
+                result = await _handle_tool(tool, tool_args)
+            except Exception as e:
+                failed = True
+                return {"tool": tool, "error": str(e)}
+            return {"tool": tool, "result": result}
+
+    results = await asyncio.gather(*(run_one(op) for op in operations))
+    return {
+        "results": results,
+        "succeeded": sum("result" in r for r in results),
+        "failed": sum("error" in r for r in results),
+    }
+
+
+# Tool name -> implementation, used by _handle_tool
+_HANDLERS: dict[str, Handler] = {
+    # Service Management
+    "dns_service_status": _dns_service_status,
+    "dns_service_control": _dns_service_control,
+    "dns_service_reload": _dns_service_reload,
+    # Cache Operations
+    "dns_cache_flush": _dns_cache_flush,
+    "dns_cache_stats": _dns_cache_stats,
+    "dns_cache_purge": _dns_cache_purge,
+    # Query Operations
+    "dns_query": _dns_query,
+    "dns_query_trace": _dns_query_trace,
+    "dns_query_compare": _dns_query_compare,
+    # Configuration
+    "dns_config_validate": _dns_config_validate,
+    "dns_config_get": _dns_config_get,
+    "dns_config_diff": _dns_config_diff,
+    # Migration
+    "dns_migrate_plan": _dns_migrate_plan,
+    "dns_migrate_convert": _dns_migrate_convert,
+    "dns_migrate_validate": _dns_migrate_validate,
+    # Health
+    "dns_health_check": _dns_health_check,
+    "dns_health_metrics": _dns_health_metrics,
+    # Batching
+    "batch_execute": _batch_execute,
+}
+
+
 # ============================================================================
 # Server Entry Point
 # ============================================================================
 
 
 def run():
-    """Run the MCP server."""
-    asyncio.run(main())
+    """Run the MCP server, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
 
 
 async def main():
     """Main async entry point."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream, write_stream, server.create_initialization_options()
+            )
+    finally:
+        await close_clients()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,21 @@
 """FastAPI + htmx admin panel application."""
 
+import asyncio
+import functools
+import mimetypes
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request, Form, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
 from fastapi.templating import Jinja2Templates
 
 from dnsscience.core.coredns.client import CoreDNSClient
@@ -14,37 +25,200 @@ from dnsscience.core.models import DNSQuery, RecordType
 # Setup paths
 BASE_DIR = Path(__file__).parent
 TEMPLATES_DIR = BASE_DIR / "templates"
+STATIC_DIR = BASE_DIR / "static"
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that revalidates cached assets and serves precompressed copies.
+
+    Asset URLs aren't content-hashed, so browsers may keep a copy but must
+    check it on each use; an unchanged file costs a 304 against its ETag.
+    A ``file.ext.gz`` next to ``file.ext`` is sent as-is to clients
+    accepting gzip instead of the uncompressed file.
+    """
+
+    CACHE_CONTROL = "no-cache"
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+
+        if "gzip" in request_headers.get("accept-encoding", ""):
+            gz_path = f"{full_path}.gz"
+            try:
+                gz_stat = os.stat(gz_path)
+            except OSError:
+                pass
+            else:
+                media_type = mimetypes.guess_type(str(full_path))[0] or "text/plain"
+                response = FileResponse(
+                    gz_path,
+                    status_code=status_code,
+                    stat_result=gz_stat,
+                    media_type=media_type,
+                    headers={"Content-Encoding": "gzip"},
+                )
+                return self._cacheable(response, request_headers)
+
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        return self._cacheable(response, request_headers)
+
+    def _cacheable(self, response: Response, request_headers: Headers) -> Response:
+        """Add caching headers, answering 304 when the client copy is current."""
+        response.headers["Cache-Control"] = self.CACHE_CONTROL
+        # Either encoding may be served from this URL
+        response.headers["Vary"] = "Accept-Encoding"
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
 
-# Create app
-app = FastAPI(
-    title="DNS Science Admin",
-    description="Lightweight admin panel for DNS management",
-)
 
 # Templates
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
+# Partials polled by the dashboard are rendered directly, skipping TemplateResponse
+_SERVICE_STATUS_TPL = templates.get_template("partials/service_status.html")
+_CACHE_STATS_TPL = templates.get_template("partials/cache_stats.html")
+_HEALTH_STATUS_TPL = templates.get_template("partials/health_status.html")
+
+# Record type mnemonic -> enum member, for form parsing
+_RTYPE = {rt.value: rt for rt in RecordType}
+
+
+@functools.lru_cache(maxsize=512)
+def _make_query(name: str, record_type: RecordType) -> DNSQuery:
+    """Build a DNSQuery, reusing the validated model for repeated lookups."""
+    return DNSQuery(name=name, record_type=record_type)
+
 # Clients
 _coredns: CoreDNSClient | None = None
 _unbound: UnboundClient | None = None
 
 
+_coredns_lock = asyncio.Lock()
+_unbound_lock = asyncio.Lock()
+
+
 async def get_coredns() -> CoreDNSClient:
     global _coredns
-    if not _coredns:
-        _coredns = CoreDNSClient()
-        await _coredns.connect()
+    if _coredns:
+        return _coredns
+
+    # Concurrent first requests must not each create (and leak) a client
+    async with _coredns_lock:
+        if not _coredns:
+            client = CoreDNSClient()
+            await client.connect()
+            _coredns = client
     return _coredns
 
 
 async def get_unbound() -> UnboundClient:
     global _unbound
-    if not _unbound:
-        _unbound = UnboundClient()
-        await _unbound.connect()
+    if _unbound:
+        return _unbound
+
+    async with _unbound_lock:
+        if not _unbound:
+            client = UnboundClient()
+            await client.connect()
+            _unbound = client
     return _unbound
 
 
+# Resolver name -> client getter
+_RESOLVERS = {"coredns": get_coredns, "unbound": get_unbound}
+
+
+async def _client_for(resolver: str) -> CoreDNSClient | UnboundClient:
+    """Get the client for a resolver name from a form or query parameter."""
+    getter = _RESOLVERS.get(resolver)
+    if getter is None:
+        raise HTTPException(status_code=400, detail=f"Unknown resolver: {resolver}")
+    return await getter()
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Application lifespan manager."""
+    global _coredns, _unbound
+
+    # Startup: connect clients and compile templates before the first request
+    await asyncio.gather(get_coredns(), get_unbound())
+    for path in TEMPLATES_DIR.rglob("*.html"):
+        templates.get_template(path.relative_to(TEMPLATES_DIR).as_posix())
+
+    yield
+
+    # Shutdown
+    for client in (_coredns, _unbound):
+        if client:
+            await client.disconnect()
+    _coredns = _unbound = None
+
+
+# Create app
+app = FastAPI(
+    title="DNS Science Admin",
+    description="Lightweight admin panel for DNS management",
+    lifespan=lifespan,
+)
+
+# Static assets (optional - pages load htmx and Pico from a CDN by default)
+if STATIC_DIR.is_dir():
+    app.mount("/static", CachedStaticFiles(directory=str(STATIC_DIR)), name="static")
+
+
+# ============================================================================
+# Partial Cache
+# ============================================================================
+
+# A polled partial: resolver name -> rendered fragment
+Partial = Callable[[str], Awaitable[HTMLResponse]]
+
+# (handler name, resolver) -> (expiry, rendered body)
+_HTML_CACHE: dict[tuple[str, str], tuple[float, bytes]] = {}
+_HTML_CACHE_MAX = 64
+
+
+def _ttl_cached_html(ttl: float = 0.5) -> Callable[[Partial], Partial]:
+    """
+    Serve a polled partial's rendered HTML for ``ttl`` seconds.
+
+    Several dashboards polling the same resolver then cost one client call
+    and one render per tick.
+    """
+
+    def decorator(func: Partial) -> Partial:
+        @functools.wraps(func)
+        async def wrapper(resolver: str = "coredns") -> HTMLResponse:
+            key = (func.__name__, resolver)
+            now = time.monotonic()
+            cached = _HTML_CACHE.get(key)
+            if cached is not None and cached[0] > now:
+                return HTMLResponse(cached[1])
+
+            response = await func(resolver)
+            if len(_HTML_CACHE) >= _HTML_CACHE_MAX:
+                _HTML_CACHE.clear()
+            _HTML_CACHE[key] = (now + ttl, bytes(response.body))
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _invalidate_html() -> None:
+    """Drop cached partials after an action that changes resolver state."""
+    _HTML_CACHE.clear()
+
+
 # ============================================================================
 # Pages
 # ============================================================================
@@ -98,31 +272,22 @@ async def migrate_page(request: Request):
 
 
 @app.get("/htmx/service/status", response_class=HTMLResponse)
-async def htmx_service_status(request: Request, resolver: str = "coredns"):
+@_ttl_cached_html()
+async def htmx_service_status(resolver: str = "coredns") -> HTMLResponse:
     """Get service status partial."""
-    if resolver == "coredns":
-        client = await get_coredns()
-    else:
-        client = await get_unbound()
+    client = await _client_for(resolver)
 
     status = await client.get_status()
-    return templates.TemplateResponse(
-        "partials/service_status.html",
-        {"request": request, "status": status, "resolver": resolver},
-    )
+    return HTMLResponse(_SERVICE_STATUS_TPL.render(status=status, resolver=resolver))
 
 
 @app.post("/htmx/service/control", response_class=HTMLResponse)
 async def htmx_service_control(
-    request: Request,
     action: str = Form(...),
     resolver: str = Form("coredns"),
 ):
     """Control service action."""
-    if resolver == "coredns":
-        client = await get_coredns()
-    else:
-        client = await get_unbound()
+    client = await _client_for(resolver)
 
     if action == "start":
         result = await client.start()
@@ -135,15 +300,10 @@ async def htmx_service_control(
     else:
         result = None
 
+    _invalidate_html()
     status = await client.get_status()
-    return templates.TemplateResponse(
-        "partials/service_status.html",
-        {
-            "request": request,
-            "status": status,
-            "resolver": resolver,
-            "result": result,
-        },
+    return HTMLResponse(
+        _SERVICE_STATUS_TPL.render(status=status, resolver=resolver, result=result)
     )
 
 
@@ -153,38 +313,29 @@ async def htmx_service_control(
 
 
 @app.get("/htmx/cache/stats", response_class=HTMLResponse)
-async def htmx_cache_stats(request: Request, resolver: str = "coredns"):
+@_ttl_cached_html()
+async def htmx_cache_stats(resolver: str = "coredns") -> HTMLResponse:
     """Get cache stats partial."""
-    if resolver == "coredns":
-        client = await get_coredns()
-    else:
-        client = await get_unbound()
+    client = await _client_for(resolver)
 
     stats = await client.get_cache_stats()
-    return templates.TemplateResponse(
-        "partials/cache_stats.html",
-        {"request": request, "stats": stats, "resolver": resolver},
-    )
+    return HTMLResponse(_CACHE_STATS_TPL.render(stats=stats, resolver=resolver))
 
 
 @app.post("/htmx/cache/flush", response_class=HTMLResponse)
-async def htmx_cache_flush(request: Request, resolver: str = Form("coredns")):
+async def htmx_cache_flush(resolver: str = Form("coredns")):
     """Flush cache."""
-    if resolver == "coredns":
-        client = await get_coredns()
-    else:
-        client = await get_unbound()
+    client = await _client_for(resolver)
 
     result = await client.flush_cache()
+    _invalidate_html()
     stats = await client.get_cache_stats()
-    return templates.TemplateResponse(
-        "partials/cache_stats.html",
-        {
-            "request": request,
-            "stats": stats,
-            "resolver": resolver,
-            "message": f"Cache flushed: {result.purged_count} entries",
-        },
+    return HTMLResponse(
+        _CACHE_STATS_TPL.render(
+            stats=stats,
+            resolver=resolver,
+            message=f"Cache flushed: {result.purged_count} entries",
+        )
     )
 
 
@@ -195,12 +346,10 @@ async def htmx_cache_purge(
     resolver: str = Form("coredns"),
 ):
     """Purge domain from cache."""
-    if resolver == "coredns":
-        client = await get_coredns()
-    else:
-        client = await get_unbound()
+    client = await _client_for(resolver)
 
     result = await client.purge_cache(domain=domain)
+    _invalidate_html()
     return templates.TemplateResponse(
         "partials/cache_purge_result.html",
         {"request": request, "result": result, "domain": domain},
@@ -220,16 +369,13 @@ async def htmx_query_lookup(
     resolver: str = Form("coredns"),
 ):
     """Perform DNS lookup."""
-    if resolver == "coredns":
-        client = await get_coredns()
-    else:
-        client = await get_unbound()
+    rtype = _RTYPE.get(record_type)
+    if rtype is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported record type: {record_type}")
 
-    query = DNSQuery(
-        name=domain,
-        record_type=RecordType(record_type),
-    )
-    response = await client.query(query)
+    client = await _client_for(resolver)
+
+    response = await client.query(_make_query(domain, rtype))
 
     return templates.TemplateResponse(
         "partials/query_result.html",
@@ -245,10 +391,7 @@ async def htmx_query_lookup(
 @app.get("/htmx/config/show", response_class=HTMLResponse)
 async def htmx_config_show(request: Request, resolver: str = "coredns"):
     """Show current configuration."""
-    if resolver == "coredns":
-        client = await get_coredns()
-    else:
-        client = await get_unbound()
+    client = await _client_for(resolver)
 
     try:
         config = await client.get_config()
@@ -268,10 +411,7 @@ async def htmx_config_validate(
     resolver: str = Form("coredns"),
 ):
     """Validate configuration."""
-    if resolver == "coredns":
-        client = await get_coredns()
-    else:
-        client = await get_unbound()
+    client = await _client_for(resolver)
 
     result = await client.validate_config(config)
 
@@ -287,18 +427,77 @@ async def htmx_config_validate(
 
 
 @app.get("/htmx/health/check", response_class=HTMLResponse)
-async def htmx_health_check(request: Request, resolver: str = "coredns"):
+@_ttl_cached_html()
+async def htmx_health_check(resolver: str = "coredns") -> HTMLResponse:
     """Health check partial."""
-    if resolver == "coredns":
-        client = await get_coredns()
-    else:
-        client = await get_unbound()
+    client = await _client_for(resolver)
 
     health = await client.health_check()
+    return HTMLResponse(_HEALTH_STATUS_TPL.render(health=health, resolver=resolver))
 
-    return templates.TemplateResponse(
-        "partials/health_status.html",
-        {"request": request, "health": health, "resolver": resolver},
+
+# ============================================================================
+# htmx Streams
+# ============================================================================
+
+# Seconds between server-side checks for changed fragments; no faster than
+# the dashboard's old 10s polling
+STREAM_INTERVAL = 10.0
+
+# Streamed section -> the polled partial it pushes
+_STREAMS: dict[str, Partial] = {
+    "service": htmx_service_status,
+    "cache": htmx_cache_stats,
+    "health": htmx_health_check,
+}
+
+
+def _sse_event(event: str, html: str) -> str:
+    """Format an HTML fragment as a server-sent event."""
+    data = "".join(f"data: {line}\n" for line in html.split("\n"))
+    return f"event: {event}\n{data}\n"
+
+
+@app.get("/htmx/stream")
+async def htmx_stream(
+    request: Request, sections: str = "service,health,cache", resolver: str = "coredns"
+) -> StreamingResponse:
+    """
+    Push a page's partials over one server-sent event stream.
+
+    Replaces client-side polling: each page holds a single connection and
+    receives a section's fragment, as an event named after the section,
+    only when its rendered HTML differs from the last one sent. Renders go
+    through the partial cache, so many viewers of the same resolver share
+    one client call per interval.
+    """
+    names = list(dict.fromkeys(s for s in sections.split(",") if s))
+    unknown = [name for name in names if name not in _STREAMS]
+    if unknown or not names:
+        raise HTTPException(status_code=404, detail=f"Unknown stream: {sections}")
+    if resolver not in _RESOLVERS:
+        raise HTTPException(status_code=400, detail=f"Unknown resolver: {resolver}")
+
+    async def render(name: str) -> bytes | None:
+        try:
+            return bytes((await _STREAMS[name](resolver)).body)
+        except Exception:
+            return None
+
+    async def events() -> AsyncIterator[str]:
+        last: dict[str, bytes] = {}
+        while not await request.is_disconnected():
+            bodies = await asyncio.gather(*(render(name) for name in names))
+            for name, body in zip(names, bodies, strict=True):
+                if body is not None and body != last.get(name):
+                    last[name] = body
+                    yield _sse_event(name, body.decode())
+            await asyncio.sleep(STREAM_INTERVAL)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -308,14 +507,20 @@ async def htmx_health_check(request: Request, resolver: str = "coredns"):
 
 
 def run():
-    """Run the admin panel."""
+    """Run the admin panel.
+
+    Auto-reload is opt-in via ``DNSSCIENCE_RELOAD=1``; ``DNSSCIENCE_WORKERS``
+    sets the number of worker processes. uvicorn picks uvloop and httptools
+    automatically when ``uvicorn[standard]`` is installed.
+    """
     import uvicorn
 
     uvicorn.run(
         "dnsscience.web.admin.app:app",
         host="0.0.0.0",
         port=8081,
-        reload=True,
+        reload=os.getenv("DNSSCIENCE_RELOAD") == "1",
+        workers=int(os.getenv("DNSSCIENCE_WORKERS", "1")),
     )
 
 
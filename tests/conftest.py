@@ -1,36 +1,84 @@
 """Pytest configuration and fixtures."""
 
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Final
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from httpx import AsyncClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
+from dnsscience.api.main import app
 from dnsscience.core.models import (
     CacheStats,
     DNSQuery,
     DNSRecord,
     DNSResponse,
+    HealthState,
     HealthStatus,
     RecordType,
     ResolverType,
-    ServiceHealth,
+    ServiceState,
     ServiceStatus,
 )
 from dnsscience.core.coredns.client import CoreDNSClient
 from dnsscience.core.unbound.client import UnboundClient
 
+# Run async tests on uvloop when it's installed (pytest-asyncio uses the global policy)
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+SAMPLE_COREFILE: Final = """.:53 {
+    errors
+    health {
+        lameduck 5s
+    }
+    ready
+    kubernetes cluster.local in-addr.arpa ip6.arpa {
+        pods insecure
+        fallthrough in-addr.arpa ip6.arpa
+        ttl 30
+    }
+    prometheus :9153
+    forward . /etc/resolv.conf {
+        max_concurrent 1000
+    }
+    cache 30
+    loop
+    reload
+    loadbalance
+}
+"""
 
+SAMPLE_UNBOUND_CONF: Final = """server:
+    interface: 0.0.0.0
+    port: 53
+    access-control: 0.0.0.0/0 allow
+    do-ip4: yes
+    do-ip6: yes
+    do-udp: yes
+    do-tcp: yes
+    cache-max-ttl: 86400
+    cache-min-ttl: 0
+    prefetch: yes
+    num-threads: 4
+    verbosity: 1
 
-@pytest.fixture
+forward-zone:
+    name: "."
+    forward-addr: 8.8.8.8
+    forward-addr: 8.8.4.4
+"""
+
+# In-process ASGI transport to the API app, reused by every test client
+_TRANSPORT = ASGITransport(app=app)
+
+
+@pytest.fixture(scope="session")
 def sample_dns_query() -> DNSQuery:
     """Sample DNS query fixture."""
     return DNSQuery(
@@ -39,7 +87,7 @@ def sample_dns_query() -> DNSQuery:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dns_response(sample_dns_query: DNSQuery) -> DNSResponse:
     """Sample DNS response fixture."""
     return DNSResponse(
@@ -49,7 +97,7 @@ def sample_dns_response(sample_dns_query: DNSQuery) -> DNSResponse:
                 name="example.com",
                 record_type=RecordType.A,
                 ttl=300,
-                data="93.184.216.34",
+                value="93.184.216.34",
             )
         ],
         rcode="NOERROR",
@@ -58,91 +106,53 @@ def sample_dns_response(sample_dns_query: DNSQuery) -> DNSResponse:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cache_stats() -> CacheStats:
     """Sample cache stats fixture."""
     return CacheStats(
+        resolver=ResolverType.COREDNS,
         size=1500,
         hits=10000,
         misses=2500,
-        hit_rate=0.8,
+        hit_ratio=0.8,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_service_status() -> ServiceStatus:
     """Sample service status fixture."""
     return ServiceStatus(
         resolver=ResolverType.COREDNS,
-        running=True,
+        state=ServiceState.RUNNING,
         uptime_seconds=86400,
         version="1.11.1",
         config_path="/etc/coredns/Corefile",
     )
 
 
-@pytest.fixture
-def sample_health_status() -> HealthStatus:
+@pytest.fixture(scope="session")
+def sample_health_status(
+    sample_service_status: ServiceStatus, sample_cache_stats: CacheStats
+) -> HealthStatus:
     """Sample health status fixture."""
     return HealthStatus(
-        state=ServiceHealth.HEALTHY,
-        checks={
-            "dns_resolution": True,
-            "upstream_connectivity": True,
-            "config_valid": True,
-        },
-        message="All checks passed",
+        resolver=ResolverType.COREDNS,
+        state=HealthState.HEALTHY,
+        service_status=sample_service_status,
+        cache_stats=sample_cache_stats,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_corefile() -> str:
     """Sample Corefile content."""
-    return """.:53 {
-    errors
-    health {
-        lameduck 5s
-    }
-    ready
-    kubernetes cluster.local in-addr.arpa ip6.arpa {
-        pods insecure
-        fallthrough in-addr.arpa ip6.arpa
-        ttl 30
-    }
-    prometheus :9153
-    forward . /etc/resolv.conf {
-        max_concurrent 1000
-    }
-    cache 30
-    loop
-    reload
-    loadbalance
-}
-"""
+    return SAMPLE_COREFILE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_unbound_conf() -> str:
     """Sample unbound.conf content."""
-    return """server:
-    interface: 0.0.0.0
-    port: 53
-    access-control: 0.0.0.0/0 allow
-    do-ip4: yes
-    do-ip6: yes
-    do-udp: yes
-    do-tcp: yes
-    cache-max-ttl: 86400
-    cache-min-ttl: 0
-    prefetch: yes
-    num-threads: 4
-    verbosity: 1
-
-forward-zone:
-    name: "."
-    forward-addr: 8.8.8.8
-    forward-addr: 8.8.4.4
-"""
+    return SAMPLE_UNBOUND_CONF
 
 
 @pytest.fixture
@@ -160,10 +170,8 @@ def mock_unbound_client() -> UnboundClient:
     return client
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def api_client() -> AsyncGenerator[AsyncClient, None]:
-    """Async HTTP client for API testing."""
-    from dnsscience.api.main import app
-
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    """Async HTTP client for API testing, shared by the whole session."""
+    async with AsyncClient(transport=_TRANSPORT, base_url="http://test") as client:
         yield client
@@ -0,0 +1,56 @@
+"""Shared test doubles and stub helpers."""
+
+from collections import deque
+
+from dnsscience.core.models import DNSQuery, DNSResponse, ResolverType
+
+
+def async_return(value):
+    """Return a coroutine function that resolves to ``value``.
+
+    A cheaper stand-in for ``AsyncMock(return_value=value)`` when a test
+    never inspects the calls.
+    """
+
+    async def _stub(*_args, **_kwargs):
+        return value
+
+    return _stub
+
+
+def returns(value):
+    """Return a plain function that always returns ``value``."""
+    return lambda *_args, **_kwargs: value
+
+
+class FakeDNSClient:
+    """In-process resolver client that replays canned responses.
+
+    Queued ``responses`` are returned in order, then ``default`` for every
+    later query. Exceptions are raised instead of returned.
+    """
+
+    def __init__(self, resolver_type: ResolverType, *responses, default=None):
+        self.resolver_type = resolver_type
+        self.responses = deque(responses)
+        self.default = default
+        self.call_count = 0
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "FakeDNSClient":
+        return self
+
+    async def __aexit__(self, *_exc_info) -> None:
+        pass
+
+    async def query(self, _query: DNSQuery) -> DNSResponse:
+        self.call_count += 1
+        result = self.responses.popleft() if self.responses else self.default
+        if isinstance(result, Exception):
+            raise result
+        return result
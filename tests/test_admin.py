@@ -0,0 +1,53 @@
+"""Tests for the admin panel."""
+
+import gzip
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from dnsscience.web.admin.app import CachedStaticFiles
+
+
+class TestCachedStaticFiles:
+    """Tests for static asset caching headers."""
+
+    @pytest.fixture
+    async def client(self, tmp_path):
+        (tmp_path / "app.js").write_text("console.log('dns');\n")
+        (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"console.log('dns');\n"))
+        (tmp_path / "app.css").write_text("body { margin: 0; }\n")
+        transport = ASGITransport(app=CachedStaticFiles(directory=str(tmp_path)))
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+    @pytest.mark.parametrize(
+        "path,accept_encoding,content_encoding",
+        [
+            ("/app.js", "gzip", "gzip"),
+            ("/app.js", "identity", None),
+            ("/app.css", "gzip", None),
+        ],
+        ids=["precompressed", "identity", "no-gz-copy"],
+    )
+    async def test_revalidates_with_vary(
+        self, client, path, accept_encoding, content_encoding
+    ):
+        response = await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert "etag" in response.headers
+        assert response.headers.get("content-encoding") == content_encoding
+
+    async def test_unchanged_asset_is_not_modified(self, client):
+        first = await client.get("/app.js", headers={"Accept-Encoding": "gzip"})
+
+        response = await client.get(
+            "/app.js",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.headers["vary"] == "Accept-Encoding"
@@ -1,327 +1,354 @@
 """Tests for REST API endpoints."""
 
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from httpx import AsyncClient
 
+from dnsscience.api.main import app
+from dnsscience.api.routers import cache as cache_router
+from dnsscience.api.routers import compare as compare_router
+from dnsscience.api.routers import health as health_router
+from dnsscience.api.routers import query as query_router
+from dnsscience.api.routers import service as service_router
 from dnsscience.core.models import (
+    CachePurgeResult,
     CacheStats,
     DNSQuery,
     DNSRecord,
     DNSResponse,
+    HealthState,
     HealthStatus,
     RecordType,
     ResolverType,
-    ServiceHealth,
+    ServiceControlResult,
+    ServiceState,
     ServiceStatus,
 )
+from tests.helpers import FakeDNSClient, async_return
 
+COREFILE = ".:53 {\n    forward . 8.8.8.8\n}\n"
 
-@pytest.fixture
-def mock_coredns():
-    """Mock CoreDNS client."""
-    with patch("dnsscience.api.routers.service.coredns") as mock:
-        mock.status = AsyncMock(
-            return_value=ServiceStatus(
-                resolver=ResolverType.COREDNS,
-                running=True,
-                uptime_seconds=3600,
-                version="1.11.1",
-            )
-        )
-        mock.start = AsyncMock(return_value=True)
-        mock.stop = AsyncMock(return_value=True)
-        mock.restart = AsyncMock(return_value=True)
-        mock.reload = AsyncMock(return_value=True)
-        yield mock
-
-
-@pytest.fixture
-def mock_cache():
-    """Mock cache operations."""
-    with patch("dnsscience.api.routers.cache.coredns") as mock:
-        mock.get_cache_stats = AsyncMock(
-            return_value=CacheStats(
-                size=1000,
-                hits=8000,
-                misses=2000,
-                hit_rate=0.8,
-            )
-        )
-        mock.flush_cache = AsyncMock(return_value=True)
-        yield mock
+
+@contextmanager
+def override_client(router, client):
+    """Serve ``client`` from ``router.get_client`` until the block exits."""
+    app.dependency_overrides[router.get_client] = lambda: client
+    try:
+        yield client
+    finally:
+        app.dependency_overrides.pop(router.get_client, None)
+
+
+@pytest.fixture(scope="module")
+def service_status() -> ServiceStatus:
+    """Status payload returned by the stubbed client."""
+    return ServiceStatus(
+        resolver=ResolverType.COREDNS,
+        state=ServiceState.RUNNING,
+        uptime_seconds=3600,
+        version="1.11.1",
+    )
 
 
+@pytest.fixture(scope="module")
+def cache_stats() -> CacheStats:
+    """Cache stats payload returned by the stubbed client."""
+    return CacheStats(
+        resolver=ResolverType.COREDNS,
+        size=1000,
+        hits=8000,
+        misses=2000,
+        hit_ratio=0.8,
+    )
+
+
+@pytest.mark.xdist_group(name="api-service")
 class TestServiceEndpoints:
     """Tests for /service endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_get_status(self, api_client, mock_coredns):
-        response = await api_client.get("/api/v1/service/status")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["resolver"] == "coredns"
-        assert data["running"] is True
-
-    @pytest.mark.asyncio
-    async def test_start_service(self, api_client, mock_coredns):
-        response = await api_client.post("/api/v1/service/start")
-        assert response.status_code == 200
-        mock_coredns.start.assert_called_once()
+    @staticmethod
+    @pytest.fixture(scope="class", autouse=True)
+    def mock_coredns(service_status):
+        """Mock CoreDNS client."""
+        mock = MagicMock()
+        mock.get_status = async_return(service_status)
+        for action in ("start", "stop", "restart", "reload"):
+            setattr(
+                mock,
+                action,
+                AsyncMock(
+                    return_value=ServiceControlResult(
+                        action=action,
+                        success=True,
+                        message=f"{action} ok",
+                        previous_state=ServiceState.RUNNING,
+                        current_state=ServiceState.RUNNING,
+                    )
+                ),
+            )
+        with override_client(service_router, mock):
+            yield mock
 
-    @pytest.mark.asyncio
-    async def test_stop_service(self, api_client, mock_coredns):
-        response = await api_client.post("/api/v1/service/stop")
-        assert response.status_code == 200
-        mock_coredns.stop.assert_called_once()
+    @pytest.fixture(autouse=True)
+    def _reset_calls(self, mock_coredns):
+        """Clear recorded calls so each test starts from a clean mock."""
+        yield
+        mock_coredns.reset_mock()
 
-    @pytest.mark.asyncio
-    async def test_restart_service(self, api_client, mock_coredns):
-        response = await api_client.post("/api/v1/service/restart")
+    async def test_get_status(self, api_client, service_status):
+        response = await api_client.get("/api/v1/service/status")
         assert response.status_code == 200
-        mock_coredns.restart.assert_called_once()
+        assert response.json() == service_status.model_dump(mode="json")
 
-    @pytest.mark.asyncio
-    async def test_reload_config(self, api_client, mock_coredns):
-        response = await api_client.post("/api/v1/service/reload")
+    @pytest.mark.parametrize("action", ["start", "stop", "restart", "reload"])
+    async def test_service_action(self, api_client, mock_coredns, action):
+        response = await api_client.post(f"/api/v1/service/{action}")
         assert response.status_code == 200
-        mock_coredns.reload.assert_called_once()
+        assert response.json()["action"] == action
+        assert response.json()["success"] is True
+        getattr(mock_coredns, action).assert_awaited_once()
 
 
+@pytest.mark.xdist_group(name="api-cache")
 class TestCacheEndpoints:
     """Tests for /cache endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_get_cache_stats(self, api_client, mock_cache):
+    @staticmethod
+    @pytest.fixture(scope="class", autouse=True)
+    def mock_cache(cache_stats):
+        """Mock cache operations."""
+        mock = MagicMock()
+        mock.get_cache_stats = async_return(cache_stats)
+        mock.flush_cache = AsyncMock(return_value=CachePurgeResult(purged_count=42))
+        with override_client(cache_router, mock):
+            yield mock
+
+    @pytest.fixture(autouse=True)
+    def _reset_calls(self, mock_cache):
+        """Clear recorded calls so each test starts from a clean mock."""
+        yield
+        mock_cache.reset_mock()
+
+    async def test_get_cache_stats(self, api_client, cache_stats):
         response = await api_client.get("/api/v1/cache/stats")
         assert response.status_code == 200
-        data = response.json()
-        assert data["size"] == 1000
-        assert data["hit_rate"] == 0.8
+        assert response.json() == cache_stats.model_dump(mode="json")
 
-    @pytest.mark.asyncio
     async def test_flush_cache(self, api_client, mock_cache):
-        response = await api_client.post("/api/v1/cache/flush")
+        response = await api_client.delete("/api/v1/cache")
         assert response.status_code == 200
-        mock_cache.flush_cache.assert_called_once()
+        assert response.json()["purged_count"] == 42
+        mock_cache.flush_cache.assert_awaited_once()
 
 
+@pytest.mark.xdist_group(name="api-query")
 class TestQueryEndpoints:
     """Tests for /query endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_query_domain(self, api_client):
-        with patch("dnsscience.api.routers.query.coredns") as mock:
-            mock.query = AsyncMock(
-                return_value=DNSResponse(
-                    query=DNSQuery(name="example.com", record_type=RecordType.A),
-                    records=[
-                        DNSRecord(
-                            name="example.com",
-                            record_type=RecordType.A,
-                            ttl=300,
-                            data="93.184.216.34",
-                        )
-                    ],
-                    rcode="NOERROR",
-                    query_time_ms=25.0,
-                    server="127.0.0.1",
-                )
-            )
-
-            response = await api_client.get(
-                "/api/v1/query",
-                params={"domain": "example.com", "type": "A"},
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["rcode"] == "NOERROR"
-            assert len(data["records"]) == 1
-
-    @pytest.mark.asyncio
-    async def test_query_with_server(self, api_client):
-        with patch("dnsscience.api.routers.query.coredns") as mock:
-            mock.query = AsyncMock(
-                return_value=DNSResponse(
-                    query=DNSQuery(
+    @staticmethod
+    @pytest.fixture(scope="class", autouse=True)
+    def mock_query():
+        """Mock query router client."""
+        mock = MagicMock()
+        with override_client(query_router, mock):
+            yield mock
+
+    @pytest.mark.parametrize(
+        "params,records,server",
+        [
+            (
+                {},
+                [
+                    DNSRecord(
                         name="example.com",
                         record_type=RecordType.A,
-                        server="8.8.8.8",
-                    ),
-                    records=[],
-                    rcode="NOERROR",
-                    query_time_ms=50.0,
-                    server="8.8.8.8",
-                )
+                        ttl=300,
+                        value="93.184.216.34",
+                    )
+                ],
+                "127.0.0.1",
+            ),
+            ({"server": "8.8.8.8"}, [], "8.8.8.8"),
+        ],
+        ids=["default-server", "explicit-server"],
+    )
+    async def test_query(self, api_client, mock_query, params, records, server):
+        mock_query.query = AsyncMock(
+            return_value=DNSResponse(
+                query=DNSQuery(name="example.com", record_type=RecordType.A),
+                records=records,
+                rcode="NOERROR",
+                query_time_ms=25.0,
+                server=server,
             )
+        )
 
-            response = await api_client.get(
-                "/api/v1/query",
-                params={"domain": "example.com", "type": "A", "server": "8.8.8.8"},
-            )
+        response = await api_client.post(
+            "/api/v1/query",
+            json={"name": "example.com", "record_type": "A", **params},
+        )
 
-            assert response.status_code == 200
+        assert response.status_code == 200
+        data = response.json()
+        assert data["rcode"] == "NOERROR"
+        assert len(data["records"]) == len(records)
+        sent = mock_query.query.await_args.args[0]
+        assert sent.name == "example.com"
+        assert sent.server == params.get("server")
 
 
+@pytest.mark.xdist_group(name="api-compare")
 class TestCompareEndpoints:
     """Tests for /compare endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_compare_single(self, api_client):
-        with patch("dnsscience.api.routers.compare.compare_engine") as mock:
-            from dnsscience.core.models import CompareResult
-
-            query = DNSQuery(name="example.com", record_type=RecordType.A)
-            response = DNSResponse(
-                query=query,
-                records=[],
-                rcode="NOERROR",
-                query_time_ms=10.0,
-                server="test",
-            )
-            mock.compare = AsyncMock(
-                return_value=CompareResult(
-                    query=query,
-                    source_response=response,
-                    target_response=response,
-                    match=True,
-                    timing_diff_ms=0.5,
+    @pytest.fixture
+    def dns_response(self):
+        return DNSResponse(
+            query=DNSQuery(name="example.com", record_type=RecordType.A),
+            records=[
+                DNSRecord(
+                    name="example.com",
+                    record_type=RecordType.A,
+                    ttl=300,
+                    value="93.184.216.34",
                 )
-            )
-
-            response = await api_client.get(
-                "/api/v1/compare/single",
-                params={"domain": "example.com", "type": "A"},
-            )
+            ],
+            rcode="NOERROR",
+            query_time_ms=10.0,
+            server="test",
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["match"] is True
-
-    @pytest.mark.asyncio
-    async def test_compare_bulk(self, api_client):
-        with patch("dnsscience.api.routers.compare.compare_engine") as mock:
-            from dnsscience.core.models import BulkCompareResult
-
-            mock.compare_bulk = AsyncMock(
-                return_value=BulkCompareResult(
-                    queries_tested=3,
-                    matches=3,
-                    mismatches=0,
-                    errors=0,
-                    confidence_score=1.0,
-                    results=[],
-                )
-            )
+    @pytest.fixture
+    def resolvers(self, monkeypatch, dns_response):
+        """Source served by the dependency, target built by the router."""
+        source = FakeDNSClient(ResolverType.COREDNS, default=dns_response)
+        target = FakeDNSClient(ResolverType.UNBOUND, default=dns_response)
+        monkeypatch.setattr(compare_router, "CoreDNSClient", lambda **_kwargs: target)
+        with override_client(compare_router, source):
+            yield source, target
+
+    async def test_compare_single(self, api_client, resolvers):
+        source, target = resolvers
+
+        response = await api_client.post(
+            "/api/v1/compare",
+            json={"domain": "example.com", "record_type": "A"},
+        )
 
-            response = await api_client.post(
-                "/api/v1/compare/bulk",
-                json={
-                    "domains": ["example.com", "google.com", "cloudflare.com"],
-                    "type": "A",
-                },
-            )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["match"] is True
+        assert data["records_match"] is True
+        assert source.call_count == target.call_count == 1
+
+    async def test_compare_bulk(self, api_client, resolvers):
+        source, target = resolvers
+
+        response = await api_client.post(
+            "/api/v1/compare/bulk",
+            json={
+                "domains": ["example.com", "google.com", "cloudflare.com"],
+                "record_type": "A",
+            },
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["confidence_score"] == 1.0
+        assert response.status_code == 200
+        data = response.json()
+        assert data["source"] == "coredns"
+        assert data["target"] == "unbound"
+        assert data["queries_tested"] == 3
+        assert data["matches"] == 3
+        assert data["confidence_score"] == 1.0
+        assert source.call_count == target.call_count == 3
 
 
+@pytest.mark.xdist_group(name="api-migrate")
 class TestMigrateEndpoints:
-    """Tests for /migrate endpoints."""
+    """Tests for /migrate endpoints, run against the real migrators."""
 
-    @pytest.mark.asyncio
     async def test_create_plan(self, api_client):
-        with patch("dnsscience.api.routers.migrate.migration_engine") as mock:
-            from dnsscience.core.models import MigrationPlan, MigrationStep
-
-            mock.create_plan = MagicMock(
-                return_value=MigrationPlan(
-                    source=ResolverType.COREDNS,
-                    target=ResolverType.UNBOUND,
-                    steps=[
-                        MigrationStep(
-                            order=1,
-                            description="Parse configuration",
-                            automated=True,
-                        )
-                    ],
-                    warnings=["Some plugins may not convert"],
-                    source_config=".:53 { forward . 8.8.8.8 }",
-                    target_config="forward-zone:\n    name: .\n    forward-addr: 8.8.8.8",
-                )
-            )
+        response = await api_client.post(
+            "/api/v1/migrate/plan",
+            json={"source": "coredns", "target": "unbound", "config": COREFILE},
+        )
 
-            response = await api_client.post(
-                "/api/v1/migrate/plan",
-                json={
-                    "source": "coredns",
-                    "target": "unbound",
-                    "config": ".:53 { forward . 8.8.8.8 }",
-                },
-            )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["source"] == "coredns"
+        assert data["target"] == "unbound"
+        assert "forward-addr: 8.8.8.8" in data["target_config"]
+        assert len(data["steps"]) > 0
+
+    async def test_create_plan_unsupported(self, api_client):
+        response = await api_client.post(
+            "/api/v1/migrate/plan",
+            json={"source": "coredns", "target": "bind", "config": COREFILE},
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["source"] == "coredns"
-            assert data["target"] == "unbound"
-            assert len(data["steps"]) > 0
+        assert response.status_code == 200
+        assert "error" in response.json()
 
-    @pytest.mark.asyncio
     async def test_convert_config(self, api_client):
-        with patch("dnsscience.api.routers.migrate.migration_engine") as mock:
-            mock.convert = MagicMock(
-                return_value="forward-zone:\n    name: .\n    forward-addr: 8.8.8.8"
-            )
-
-            response = await api_client.post(
-                "/api/v1/migrate/convert",
-                json={
-                    "source": "coredns",
-                    "target": "unbound",
-                    "config": ".:53 { forward . 8.8.8.8 }",
-                },
-            )
+        response = await api_client.post(
+            "/api/v1/migrate/convert",
+            json={"source": "coredns", "target": "unbound", "config": COREFILE},
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "forward-zone" in data["converted_config"]
+        assert response.status_code == 200
+        data = response.json()
+        assert "forward-zone:" in data["converted_config"]
+        assert "forward-addr: 8.8.8.8" in data["converted_config"]
 
 
+@pytest.mark.xdist_group(name="api-health")
 class TestHealthEndpoints:
     """Tests for /health endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_health_check(self, api_client):
-        with patch("dnsscience.api.routers.health.coredns") as mock:
-            mock.health_check = AsyncMock(
-                return_value=HealthStatus(
-                    state=ServiceHealth.HEALTHY,
-                    checks={"dns": True, "upstream": True},
-                )
+    @staticmethod
+    @pytest.fixture(scope="class", autouse=True)
+    def mock_health():
+        """Mock health router client."""
+        mock = MagicMock()
+        with override_client(health_router, mock):
+            yield mock
+
+    async def test_health_check(self, api_client, mock_health, service_status):
+        mock_health.health_check = async_return(
+            HealthStatus(
+                resolver=ResolverType.COREDNS,
+                state=HealthState.HEALTHY,
+                service_status=service_status,
             )
+        )
 
-            response = await api_client.get("/api/v1/health")
+        response = await api_client.get("/api/v1/health")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["state"] == "healthy"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["state"] == "healthy"
 
-    @pytest.mark.asyncio
     async def test_health_liveness(self, api_client):
         response = await api_client.get("/api/v1/health/live")
         assert response.status_code == 200
+        assert response.json() == {"status": "alive"}
+
+    @pytest.mark.parametrize(
+        "state,expected",
+        [
+            (ServiceState.RUNNING, {"status": "ready"}),
+            (ServiceState.STOPPED, {"status": "not_ready", "reason": "stopped"}),
+        ],
+        ids=["running", "stopped"],
+    )
+    async def test_health_readiness(
+        self, api_client, mock_health, service_status, state, expected
+    ):
+        mock_health.get_status = async_return(
+            service_status.model_copy(update={"state": state})
+        )
 
-    @pytest.mark.asyncio
-    async def test_health_readiness(self, api_client):
-        with patch("dnsscience.api.routers.health.coredns") as mock:
-            mock.health_check = AsyncMock(
-                return_value=HealthStatus(
-                    state=ServiceHealth.HEALTHY,
-                    checks={},
-                )
-            )
+        response = await api_client.get("/api/v1/health/ready")
 
-            response = await api_client.get("/api/v1/health/ready")
-            assert response.status_code == 200
+        assert response.status_code == 200
+        assert response.json() == expected
@@ -3,7 +3,7 @@
 import pytest
 
 from dnsscience.core.coredns.config import CorefileParser, CorefileGenerator
-from dnsscience.core.models import ValidationResult
+from dnsscience.core.models import ConfigValidationError, ConfigValidationResult
 
 
 class TestCorefileParser:
@@ -51,7 +51,7 @@ cluster.local:53 {
         parser = CorefileParser()
         result = parser.validate(sample_corefile)
 
-        assert isinstance(result, ValidationResult)
+        assert isinstance(result, ConfigValidationResult)
         assert result.valid is True
         assert len(result.errors) == 0
 
@@ -109,6 +109,17 @@ cluster.local:53 {
         forward_config = result["."]["plugins"]["forward"]
         assert "8.8.8.8" in forward_config or "8.8.8.8" in str(forward_config)
 
+    def test_cached_results_are_not_shared(self, sample_corefile):
+        parser = CorefileParser()
+
+        parsed = parser.parse(sample_corefile)
+        parsed.servers[0].plugins.clear()
+        validated = parser.validate(sample_corefile)
+        validated.errors.append(ConfigValidationError(message="injected"))
+
+        assert parser.parse(sample_corefile).servers[0].plugins
+        assert parser.validate(sample_corefile).errors == []
+
 
 class TestCorefileGenerator:
     """Tests for Corefile generator."""
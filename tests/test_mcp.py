@@ -0,0 +1,59 @@
+"""Tests for the MCP server."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from dnsscience.mcp import server
+from tests.helpers import async_return
+
+
+class TestEncoding:
+    """Tests for tool response encoding."""
+
+    @pytest.fixture
+    def client(self, sample_dns_response, sample_health_status):
+        return SimpleNamespace(
+            query=async_return(sample_dns_response),
+            health_check=async_return(sample_health_status),
+        )
+
+    @pytest.mark.parametrize(
+        "tool,args",
+        [
+            ("dns_query", {"domain": "example.com"}),
+            ("dns_health_check", {}),
+        ],
+    )
+    async def test_msgspec_matches_stdlib(self, monkeypatch, client, tool, args):
+        pytest.importorskip("msgspec")
+        monkeypatch.setattr(server, "get_coredns_client", async_return(client))
+
+        result = await server._handle_tool(tool, args)
+        encoded = server._MSGSPEC_ENCODER.encode(result).decode()
+
+        assert encoded == server._ENCODER.encode(result)
+        assert json.loads(encoded)["timestamp"] == result["timestamp"].isoformat()
+
+
+class TestResponseCache:
+    """Tests for the TTL response cache on read-only tools."""
+
+    async def test_hits_return_copies(self):
+        calls = []
+
+        @server._ttl_cached(ttl=60)
+        async def handler(args):
+            calls.append(args)
+            return {"value": 1}
+
+        try:
+            first = await handler({"domain": "example.com"})
+            first["value"] = 2
+            second = await handler({"domain": "example.com"})
+        finally:
+            server._invalidate_responses()
+
+        assert second == {"value": 1}
+        assert len(calls) == 1
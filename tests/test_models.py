@@ -9,12 +9,12 @@ from dnsscience.core.models import (
     DNSQuery,
     DNSRecord,
     DNSResponse,
+    HealthState,
     HealthStatus,
     MigrationPlan,
     MigrationStep,
     RecordType,
     ResolverType,
-    ServiceHealth,
     ServiceStatus,
 )
 
@@ -70,6 +70,18 @@ class TestDNSRecord:
         )
         assert record.priority == 10
 
+    def test_records_are_frozen_and_hashable(self):
+        record = DNSRecord(
+            name="example.com",
+            record_type=RecordType.A,
+            ttl=300,
+            value="93.184.216.34",
+        )
+        duplicate = record.model_copy()
+        assert len({record, duplicate}) == 1
+        with pytest.raises(ValidationError):
+            record.ttl = 60
+
 
 class TestDNSResponse:
     """Tests for DNSResponse model."""
@@ -158,18 +170,18 @@ class TestHealthStatus:
 
     def test_healthy_status(self):
         health = HealthStatus(
-            state=ServiceHealth.HEALTHY,
+            state=HealthState.HEALTHY,
             checks={"dns": True, "upstream": True},
         )
-        assert health.state == ServiceHealth.HEALTHY
+        assert health.state == HealthState.HEALTHY
 
     def test_degraded_status(self):
         health = HealthStatus(
-            state=ServiceHealth.DEGRADED,
+            state=HealthState.DEGRADED,
             checks={"dns": True, "upstream": False},
             message="Upstream connectivity issues",
         )
-        assert health.state == ServiceHealth.DEGRADED
+        assert health.state == HealthState.DEGRADED
         assert "Upstream" in health.message
 
 
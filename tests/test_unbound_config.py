@@ -0,0 +1,51 @@
+"""Tests for Unbound configuration generation."""
+
+from dnsscience.core.unbound.config import UnboundConfigGenerator
+
+
+class TestUnboundConfigGenerator:
+    """Tests for unbound.conf generator."""
+
+    def test_generate_sections(self):
+        generator = UnboundConfigGenerator()
+        config = {
+            "server": {
+                "port": 53,
+                "interface": ["0.0.0.0", "::0"],
+                "prefetch": True,
+            },
+            "forward-zone": [
+                {
+                    "name": ".",
+                    "forward-addr": ["8.8.8.8", "8.8.4.4"],
+                    "forward-tls-upstream": False,
+                },
+            ],
+            "remote-control": {
+                "control-enable": True,
+                "control-interface": ["127.0.0.1", "::1"],
+            },
+        }
+        result = generator.generate(config)
+
+        assert result == (
+            "server:\n"
+            "    port: 53\n"
+            "    interface: 0.0.0.0\n"
+            "    interface: ::0\n"
+            "    prefetch: yes\n"
+            "\n"
+            "forward-zone:\n"
+            '    name: "."\n'
+            "    forward-addr: 8.8.8.8\n"
+            "    forward-addr: 8.8.4.4\n"
+            "    forward-tls-upstream: no\n"
+            "\n"
+            "remote-control:\n"
+            "    control-enable: yes\n"
+            "    control-interface: 127.0.0.1\n"
+            "    control-interface: ::1\n"
+        )
+
+    def test_generate_empty(self):
+        assert UnboundConfigGenerator().generate({}) == ""